@@ -18,28 +18,29 @@ function qauth
     $VENV_PYTHON $QUIRE_DIR/scripts/easy_auth.py $argv
 end
 
+# Unified CLI: quire tasks|done|task|projects
+function quire
+    env PYTHONPATH=(string join : $QUIRE_DIR $PYTHONPATH) $VENV_PYTHON -m quire $argv
+end
+
 # Create task
 function qtask
-    source $QUIRE_DIR/venv/bin/activate.fish
-    $VENV_PYTHON $QUIRE_DIR/scripts/qtask.py $argv
+    quire task $argv
 end
 
 # Mark task done
 function qdone
-    source $QUIRE_DIR/venv/bin/activate.fish
-    $VENV_PYTHON $QUIRE_DIR/scripts/qdone.py $argv
+    quire done $argv
 end
 
 # List tasks
 function qtasks
-    source $QUIRE_DIR/venv/bin/activate.fish
-    $VENV_PYTHON $QUIRE_DIR/scripts/qtasks.py $argv
+    quire tasks $argv
 end
 
 # List projects
 function qprojects
-    source $QUIRE_DIR/venv/bin/activate.fish
-    $VENV_PYTHON $QUIRE_DIR/scripts/list_projects.py $argv
+    quire projects $argv
 end
 
 echo "✅ Quire commands loaded!"
@@ -50,5 +51,8 @@ echo "  qtask 'Name' - Create new task"
 echo "  qdone OID    - Mark task as done"
 echo "  qtasks       - List all tasks"
 echo "  qprojects    - List all projects"
+echo "  quire --help - All commands"
+echo ""
+echo "Faster commands: quire daemon start --detach"
 echo ""
 echo "First time? Run: qauth"
@@ -18,28 +18,29 @@ qauth() {
     "$VENV_PYTHON" "$QUIRE_DIR/scripts/easy_auth.py" "$@"
 }
 
+# Unified CLI: quire tasks|done|task|projects
+quire() {
+    PYTHONPATH="$QUIRE_DIR${PYTHONPATH:+:$PYTHONPATH}" "$VENV_PYTHON" -m quire "$@"
+}
+
 # Create task
 qtask() {
-    source "$QUIRE_DIR/venv/bin/activate"
-    "$VENV_PYTHON" "$QUIRE_DIR/scripts/qtask.py" "$@"
+    quire task "$@"
 }
 
 # Mark task done
 qdone() {
-    source "$QUIRE_DIR/venv/bin/activate"
-    "$VENV_PYTHON" "$QUIRE_DIR/scripts/qdone.py" "$@"
+    quire done "$@"
 }
 
 # List tasks
 qtasks() {
-    source "$QUIRE_DIR/venv/bin/activate"
-    "$VENV_PYTHON" "$QUIRE_DIR/scripts/qtasks.py" "$@"
+    quire tasks "$@"
 }
 
 # List projects
 qprojects() {
-    source "$QUIRE_DIR/venv/bin/activate"
-    "$VENV_PYTHON" "$QUIRE_DIR/scripts/list_projects.py" "$@"
+    quire projects "$@"
 }
 
 echo "✅ Quire commands loaded!"
@@ -50,5 +51,8 @@ echo "  qtask 'Name' - Create new task"
 echo "  qdone OID    - Mark task as done"
 echo "  qtasks       - List all tasks"
 echo "  qprojects    - List all projects"
+echo "  quire --help - All commands"
+echo ""
+echo "Faster commands: quire daemon start --detach"
 echo ""
 echo "First time? Run: qauth"
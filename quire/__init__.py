@@ -4,8 +4,40 @@ Quire API Automation Package
 
 __version__ = "0.1.0"
 
-from .client import QuireClient
-from .auth import QuireAuth
-from .models import Project, Task, User
+import importlib
 
-__all__ = ["QuireClient", "QuireAuth", "Project", "Task", "User"]
+# Attributes are imported from their submodule on first access, so that
+# `import quire` (and the CLI) does not pay for requests until it is needed
+_LAZY_ATTRIBUTES = {
+    "QuireClient": ".client",
+    "BatchResult": ".client",
+    "CoalesceStats": ".coalesce",
+    "ResponseCache": ".cache",
+    "AsyncQuireClient": ".async_client",
+    "QuireAuth": ".auth",
+    "TokenRenewer": ".auth",
+    "CompactTask": ".models",
+    "Project": ".models",
+    "Task": ".models",
+    "User": ".models",
+    "Query": ".query",
+    "TaskIndex": ".query",
+    "RateLimiter": ".ratelimit",
+    "ThrottleStats": ".ratelimit",
+    "TokenStore": ".tokens",
+}
+
+__all__ = ["QuireClient", "AsyncQuireClient", "BatchResult", "ResponseCache", "QuireAuth", "TokenRenewer", "TokenStore", "Project", "Task", "CompactTask", "User", "Query", "TaskIndex", "RateLimiter", "ThrottleStats", "CoalesceStats"]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,255 @@
+"""
+Asyncio Quire API client
+"""
+
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+from .auth import QuireAuth
+from .client import BatchResult, QuireClient
+from .coalesce import AsyncSingleFlight, CoalesceStats
+from .models import CompactTask, Project, Task, User, Comment
+from .ratelimit import RateLimiter
+
+
+class AsyncQuireClient:
+    """
+    Asyncio client for the Quire API
+    
+    Wraps a pooled QuireClient and runs each call on a bounded worker pool,
+    so a single event loop can keep up to ``concurrency`` requests in flight
+    while sharing models, auth and keep-alive connections with the sync client.
+    """
+    
+    DEFAULT_CONCURRENCY = 10
+    STREAM_BATCH_SIZE = 256
+    
+    def __init__(
+        self,
+        auth: Optional[QuireAuth] = None,
+        api_base: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[float] = QuireClient.DEFAULT_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce: bool = True,
+    ):
+        """
+        Initialize async Quire API client
+        
+        Args:
+            auth: QuireAuth instance (creates new one if not provided)
+            api_base: API base URL (default: https://quire.io/api)
+            concurrency: Max requests in flight at once (also the pool size)
+            timeout: Per-request timeout in seconds (None waits forever)
+            rate_limiter: Request pacer/retry policy (see QuireClient)
+            coalesce: Share one request between coroutines making the same
+                read at the same time, before it takes a worker thread
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        
+        self.concurrency = concurrency
+        self.client = QuireClient(
+            auth=auth,
+            api_base=api_base,
+            pool_size=concurrency,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            coalesce=coalesce,
+        )
+        self._inflight = AsyncSingleFlight() if coalesce else None
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix="quire-async",
+        )
+    
+    @property
+    def auth(self) -> QuireAuth:
+        return self.client.auth
+    
+    @property
+    def api_base(self) -> str:
+        return self.client.api_base
+    
+    async def _call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking client call on the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+    
+    async def _read(
+        self,
+        endpoint: str,
+        parse: Callable[[Any], Any],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """GET an endpoint, joining an identical GET already in flight"""
+        def fetch() -> Any:
+            return self.client._request("GET", endpoint, params=params)
+        
+        if self._inflight is None:
+            return await self._call(lambda: parse(fetch()))
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        # Waiters share the decoded payload and each build their own models
+        return parse(await self._inflight.do(key, lambda: self._call(fetch)))
+    
+    @property
+    def coalesce_stats(self) -> CoalesceStats:
+        """Reads made so far and how many joined an identical in-flight one"""
+        return self._inflight.stats if self._inflight is not None else CoalesceStats()
+    
+    async def aclose(self):
+        """Wait for in-flight calls and close pooled connections"""
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
+        self.client.close()
+    
+    async def __aenter__(self) -> "AsyncQuireClient":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    # User methods
+    
+    async def get_current_user(self) -> User:
+        """Get currently authenticated user"""
+        return await self._read("/user/id/me", User.from_dict)
+    
+    # Project methods
+    
+    async def list_projects(self) -> List[Project]:
+        """List all projects accessible to the user"""
+        return await self._read("/project/list", lambda data: [Project.from_dict(p) for p in data])
+    
+    async def get_project(self, project_oid: str) -> Project:
+        """Get project by OID"""
+        return await self._read(f"/project/id/{project_oid}", Project.from_dict)
+    
+    # Task methods
+    
+    async def list_tasks(
+        self,
+        project_oid: str,
+        status: Optional[int] = None,
+        assignee: Optional[str] = None,
+    ) -> List[Task]:
+        """List tasks in a project (see QuireClient.list_tasks)"""
+        return await self._read(
+            f"/project/id/{project_oid}/task/list",
+            lambda data: [Task.from_dict(t) for t in data],
+            params=QuireClient._task_filters(status, assignee),
+        )
+    
+    async def iter_tasks(
+        self,
+        project_oid: str,
+        status: Optional[int] = None,
+        assignee: Optional[str] = None,
+        compact: bool = False,
+    ) -> AsyncIterator[Union[Task, CompactTask]]:
+        """Stream tasks in a project as they download (see QuireClient.iter_tasks)"""
+        iterator = self.client.iter_tasks(project_oid, status=status, assignee=assignee, compact=compact)
+        # Pull parsed tasks in small batches to keep worker hand-offs cheap
+        while True:
+            batch = await self._call(lambda: list(itertools.islice(iterator, self.STREAM_BATCH_SIZE)))
+            if not batch:
+                return
+            for task in batch:
+                yield task
+    
+    async def get_task(self, task_oid: str) -> Task:
+        """Get task by OID"""
+        return await self._read(f"/task/id/{task_oid}", Task.from_dict)
+    
+    async def create_task(
+        self,
+        project_oid: str,
+        name: str,
+        description: Optional[str] = None,
+        assignee: Optional[str] = None,
+        status: Optional[int] = None,
+        priority: Optional[int] = None,
+        start: Optional[str] = None,
+        due: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> Task:
+        """Create a new task (see QuireClient.create_task)"""
+        return await self._call(
+            self.client.create_task,
+            project_oid,
+            name,
+            description=description,
+            assignee=assignee,
+            status=status,
+            priority=priority,
+            start=start,
+            due=due,
+            tags=tags,
+        )
+    
+    async def gather(self, *awaitables: Awaitable[Any]) -> List[BatchResult]:
+        """
+        Await independent calls concurrently (see QuireClient.gather)
+        
+        Returns:
+            One BatchResult per awaitable, in argument order
+        """
+        outcomes = await asyncio.gather(*awaitables, return_exceptions=True)
+        # CancelledError is a BaseException; a cancelled call is a failure too
+        return [
+            BatchResult(i, error=outcome) if isinstance(outcome, BaseException) else BatchResult(i, value=outcome)
+            for i, outcome in enumerate(outcomes)
+        ]
+    
+    async def create_tasks(
+        self,
+        project_oid: str,
+        specs: Iterable[Dict[str, Any]],
+    ) -> List[BatchResult]:
+        """Create many tasks concurrently (see QuireClient.create_tasks)"""
+        return await self.gather(
+            *(self._call(self.client.create_task, project_oid, **spec) for spec in specs)
+        )
+    
+    async def update_task(
+        self,
+        task_oid: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[int] = None,
+        priority: Optional[int] = None,
+        start: Optional[str] = None,
+        due: Optional[str] = None,
+        assignee: Optional[str] = None,
+    ) -> Task:
+        """Update an existing task (see QuireClient.update_task)"""
+        return await self._call(
+            self.client.update_task,
+            task_oid,
+            name=name,
+            description=description,
+            status=status,
+            priority=priority,
+            start=start,
+            due=due,
+            assignee=assignee,
+        )
+    
+    async def delete_task(self, task_oid: str) -> bool:
+        """Delete a task"""
+        return await self._call(self.client.delete_task, task_oid)
+    
+    # Comment methods
+    
+    async def add_comment(self, task_oid: str, content: str) -> Comment:
+        """Add a comment to a task"""
+        return await self._call(self.client.add_comment, task_oid, content)
+    
+    async def list_comments(self, task_oid: str) -> List[Comment]:
+        """List comments on a task"""
+        return await self._read(f"/task/id/{task_oid}/comment/list", lambda data: [Comment.from_dict(c) for c in data])
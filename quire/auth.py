@@ -3,10 +3,14 @@ OAuth2 authentication for Quire API
 """
 
 import os
+import threading
 import requests
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from datetime import datetime, timedelta
 
+from .cache import account_scope
+from .tokens import TokenStore
+
 
 class QuireAuth:
     """Handle OAuth2 authentication with Quire"""
@@ -14,11 +18,15 @@ class QuireAuth:
     OAUTH_AUTHORIZE_URL = "https://quire.io/oauth"
     OAUTH_TOKEN_URL = "https://quire.io/oauth/token"
     
+    # Seconds to wait on the token endpoint; a hung refresh holds every request
+    TOKEN_TIMEOUT = 10.0
+    
     def __init__(
         self,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
         refresh_token: Optional[str] = None,
+        token_store: Optional[TokenStore] = None,
     ):
         """
         Initialize Quire OAuth handler
@@ -27,6 +35,8 @@ class QuireAuth:
             client_id: OAuth client ID (reads from QUIRE_CLIENT_ID if not provided)
             client_secret: OAuth client secret (reads from QUIRE_CLIENT_SECRET if not provided)
             refresh_token: OAuth refresh token (reads from QUIRE_REFRESH_TOKEN if not provided)
+            token_store: Share tokens with other processes (default: a TokenStore
+                         if QUIRE_TOKEN_CACHE is set, otherwise memory only)
         """
         self.client_id = client_id or os.getenv("QUIRE_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("QUIRE_CLIENT_SECRET")
@@ -35,11 +45,26 @@ class QuireAuth:
         self.access_token: Optional[str] = None
         self.token_expires_at: Optional[datetime] = None
         
+        # Serializes refreshes so threads sharing this object never race
+        # each other with a refresh token that is about to be rotated
+        self._refresh_lock = threading.Lock()
+        
         if not self.client_id or not self.client_secret:
             raise ValueError(
                 "Client ID and Secret are required. "
                 "Set QUIRE_CLIENT_ID and QUIRE_CLIENT_SECRET environment variables."
             )
+        
+        # Partitions shared caches and the token store by account; taken
+        # before a rotated refresh token is adopted so it never changes
+        self.account = account_scope(self.client_id, self.refresh_token)
+        
+        if token_store is None and os.getenv("QUIRE_TOKEN_CACHE"):
+            token_store = TokenStore()
+        self.token_store = token_store
+        
+        if self.token_store:
+            self._load_stored_tokens()
     
     def get_authorization_url(self, redirect_uri: str = "https://localhost") -> str:
         """
@@ -70,7 +95,7 @@ class QuireAuth:
             "client_secret": self.client_secret,
         }
         
-        response = requests.post(self.OAUTH_TOKEN_URL, data=data)
+        response = requests.post(self.OAUTH_TOKEN_URL, data=data, timeout=self.TOKEN_TIMEOUT)
         response.raise_for_status()
         
         token_data = response.json()
@@ -95,7 +120,7 @@ class QuireAuth:
             "client_secret": self.client_secret,
         }
         
-        response = requests.post(self.OAUTH_TOKEN_URL, data=data)
+        response = requests.post(self.OAUTH_TOKEN_URL, data=data, timeout=self.TOKEN_TIMEOUT)
         response.raise_for_status()
         
         token_data = response.json()
@@ -112,10 +137,64 @@ class QuireAuth:
         """
         # If no token or expired, refresh
         if not self.access_token or self._is_token_expired():
-            self.refresh_access_token()
+            with self._refresh_lock:
+                # Another thread may have refreshed while we waited for the lock
+                if not self.access_token or self._is_token_expired():
+                    self._refresh_shared()
         
         return self.access_token
     
+    def force_refresh(self, stale_token: Optional[str] = None) -> str:
+        """
+        Replace an access token the API rejected
+        
+        Concurrent callers that saw the same rejected token share one refresh.
+        
+        Args:
+            stale_token: The token that got a 401; if it was already replaced,
+                         the current token is returned without refreshing
+                         
+        Returns:
+            Valid access token
+        """
+        with self._refresh_lock:
+            if stale_token is None or self.access_token == stale_token:
+                self._refresh_shared(stale_token or self.access_token)
+        
+        return self.access_token
+    
+    def renew_if_expiring(self, lead_time: float) -> bool:
+        """
+        Refresh the access token if it expires within ``lead_time`` seconds
+        
+        Returns:
+            True if a refresh was made (by this call)
+        """
+        with self._refresh_lock:
+            if self.access_token and not self._is_token_expired(lead_time):
+                return False
+            return self._refresh_shared(lead_time=lead_time)
+    
+    def start_renewer(self, lead_time: float = 600.0, **kwargs) -> "TokenRenewer":
+        """Start a background TokenRenewer for this object (see TokenRenewer)"""
+        renewer = TokenRenewer(self, lead_time=lead_time, **kwargs)
+        renewer.start()
+        return renewer
+    
+    def _refresh_shared(self, stale_token: Optional[str] = None, lead_time: float = 0.0) -> bool:
+        """Refresh, unless the token store already holds a newer token (caller holds _refresh_lock)"""
+        if not self.token_store:
+            self.refresh_access_token()
+            return True
+        
+        # Another process may have refreshed while we waited for the lock
+        with self.token_store.lock():
+            self._load_stored_tokens()
+            if not self.access_token or self._is_token_expired(lead_time) or self.access_token == stale_token:
+                self.refresh_access_token()
+                return True
+        return False
+    
     def _update_tokens(self, token_data: Dict[str, any]):
         """Update internal token state"""
         self.access_token = token_data["access_token"]
@@ -127,12 +206,36 @@ class QuireAuth:
         # Update refresh token if provided
         if "refresh_token" in token_data:
             self.refresh_token = token_data["refresh_token"]
+        
+        if self.token_store:
+            self.token_store.save(
+                self.account,
+                self.access_token,
+                self.token_expires_at.timestamp(),
+                refresh_token=self.refresh_token,
+            )
     
-    def _is_token_expired(self) -> bool:
-        """Check if access token is expired"""
+    def _load_stored_tokens(self):
+        """Adopt tokens from the store when they are newer than ours"""
+        stored = self.token_store.load(self.account)
+        if not stored:
+            return
+        
+        # The entry belongs to this account, so its refresh token is the
+        # configured one or a rotation of it and supersedes ours
+        if stored.get("refresh_token"):
+            self.refresh_token = stored["refresh_token"]
+        
+        expires_at = datetime.fromtimestamp(stored.get("expires_at") or 0)
+        if stored.get("access_token") and (not self.token_expires_at or expires_at > self.token_expires_at):
+            self.access_token = stored["access_token"]
+            self.token_expires_at = expires_at
+    
+    def _is_token_expired(self, within: float = 0.0) -> bool:
+        """Check if access token is expired (or will be in ``within`` seconds)"""
         if not self.token_expires_at:
             return True
-        return datetime.now() >= self.token_expires_at
+        return datetime.now() + timedelta(seconds=within) >= self.token_expires_at
     
     def get_auth_headers(self) -> Dict[str, str]:
         """
@@ -143,3 +246,131 @@ class QuireAuth:
         """
         token = self.get_valid_access_token()
         return {"Authorization": f"Bearer {token}"}
+
+
+class TokenRenewer:
+    """
+    Daemon thread that refreshes an access token before it expires
+    
+    Requests then always find a valid token and never wait on the token
+    endpoint. The refresh happens ``lead_time`` before expiry, but never
+    earlier than half the token's lifetime, so a long lead time cannot turn
+    into back-to-back refreshes. Failed refreshes are retried with backoff
+    while the token is still valid. Once it has expired the renewer stops
+    calling the token endpoint: requests refresh inline, and renewal resumes
+    on schedule as soon as one of them has obtained a new token.
+    """
+    
+    # Share of a token's lifetime the refresh may be brought forward by
+    MAX_LEAD_FRACTION = 0.5
+    
+    def __init__(
+        self,
+        auth: QuireAuth,
+        lead_time: float = 600.0,
+        retry_interval: float = 30.0,
+        on_refresh: Optional[Callable[[datetime], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        """
+        Initialize token renewer
+        
+        Args:
+            auth: Authentication handler to keep fresh
+            lead_time: Seconds before expiry to refresh (capped at half the
+                token lifetime)
+            retry_interval: First wait after a failed refresh (doubles, up to
+                the lead time, never past expiry); also how often an expired
+                token is checked for an inline refresh
+            on_refresh: Called with the new expiry time after each refresh
+            on_error: Called with the exception when a refresh fails (e.g. to alert)
+        """
+        self.auth = auth
+        self.lead_time = lead_time
+        self.retry_interval = retry_interval
+        self.on_refresh = on_refresh
+        self.on_error = on_error
+        
+        self.refreshes = 0
+        self.failures = 0
+        self.last_error: Optional[Exception] = None
+        
+        # Remaining validity of the token when it was obtained (or first seen)
+        self._lifetime = 0.0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="quire-token-renewer", daemon=True)
+    
+    def start(self) -> "TokenRenewer":
+        self._thread.start()
+        return self
+    
+    def stop(self, timeout: Optional[float] = None):
+        """Stop renewing and wait for the thread to exit"""
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+    
+    def __enter__(self):
+        if not self._thread.is_alive():
+            self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+    
+    def _remaining(self) -> float:
+        """Seconds the current access token stays valid (0 without one)"""
+        expires_at = self.auth.token_expires_at
+        if not self.auth.access_token or not expires_at:
+            return 0.0
+        return max(0.0, (expires_at - datetime.now()).total_seconds())
+    
+    def _lead(self) -> float:
+        return min(self.lead_time, self._lifetime * self.MAX_LEAD_FRACTION)
+    
+    def _seconds_until_due(self) -> float:
+        """Seconds until the token enters the lead window"""
+        return max(0.0, self._remaining() - self._lead())
+    
+    def _run(self):
+        backoff = self.retry_interval
+        self._lifetime = self._remaining()
+        wait = self._seconds_until_due()
+        expired = False
+        while not self._stopped.wait(wait):
+            if expired:
+                # Left to inline refreshes; only resume once one has succeeded
+                if not self._remaining():
+                    wait = self.retry_interval
+                    continue
+                expired = False
+                self._lifetime = self._remaining()
+                wait = self._seconds_until_due() or self.retry_interval
+                continue
+            
+            try:
+                refreshed = self.auth.renew_if_expiring(self._lead())
+            except Exception as e:
+                self.failures += 1
+                self.last_error = e
+                if self.on_error:
+                    self.on_error(e)
+                remaining = self._remaining()
+                if not remaining:
+                    expired = True
+                    backoff = self.retry_interval
+                    wait = self.retry_interval
+                    continue
+                wait = min(backoff, remaining)
+                backoff = min(backoff * 2, max(self._lead(), self.retry_interval))
+                continue
+            
+            backoff = self.retry_interval
+            self._lifetime = self._remaining()
+            if refreshed:
+                self.refreshes += 1
+                if self.on_refresh:
+                    self.on_refresh(self.auth.token_expires_at)
+            
+            # Only a token issued already expired (or nearly) leaves nothing to wait for
+            wait = self._seconds_until_due() or self.retry_interval
@@ -0,0 +1,256 @@
+"""
+Persistent on-disk cache for Quire API GET responses
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlencode
+
+
+@dataclass
+class CacheEntry:
+    """Cached response body with its HTTP validators"""
+    body: Any
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def account_scope(client_id: Optional[str], refresh_token: Optional[str] = None) -> str:
+    """
+    Cache key prefix identifying the account a response was fetched for
+    
+    Built from the configured OAuth client ID and refresh token, so the
+    scope stays the same when the token store rotates the refresh token.
+    """
+    return hashlib.sha256(f"{client_id or ''}:{refresh_token or ''}".encode()).hexdigest()[:16]
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of GET responses, one JSON file per request
+    
+    Entries younger than ``ttl`` are served without touching the network;
+    older ones are revalidated with If-None-Match / If-Modified-Since.
+    Keys include an account scope, so accounts sharing a cache directory
+    never see each other's responses.
+    
+    Each file holds a one-line JSON header (stored_at and validators)
+    followed by the raw response body, so a body can be streamed from disk
+    without decoding it whole (see ``open``).
+    """
+    
+    DEFAULT_TTL = 60.0
+    DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+    INVALIDATED_MARKER = ".invalidated"
+    
+    # Rescan the directory at least this often, to see other processes' writes
+    EVICT_EVERY = 64
+    
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize response cache
+        
+        Args:
+            directory: Cache directory (reads QUIRE_CACHE_DIR, default: ~/.cache/quire)
+            ttl: Seconds an entry is served without revalidation
+            max_bytes: Disk budget; least recently used entries are evicted past it
+        """
+        if directory is None:
+            directory = os.getenv("QUIRE_CACHE_DIR") or os.path.join(
+                os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "quire"
+            )
+        
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        
+        # Responses contain private workspace data
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        
+        # Bytes on disk as of the last scan plus what was written since
+        # (None until the first scan), so most writes skip the scan
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self._writes = 0
+    
+    @staticmethod
+    def key(url: str, params: Optional[Dict] = None, scope: str = "") -> str:
+        """Cache key for a GET of ``url`` with query ``params`` made by the account ``scope``"""
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(f"{scope}\n{url}?{query}".encode()).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+    
+    def _invalidated_at(self) -> float:
+        try:
+            return (self.directory / self.INVALIDATED_MARKER).stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+    
+    def open(self, key: str) -> Optional[Tuple[CacheEntry, IO[bytes]]]:
+        """
+        Load an entry's header, leaving its body on disk
+        
+        Returns:
+            (entry with ``body`` None, binary file positioned at the raw
+            JSON body) for the caller to read and close, or None if not cached
+        """
+        path = self._path(key)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        try:
+            entry = CacheEntry(body=None, **json.loads(f.readline()))
+        except (ValueError, TypeError):
+            f.close()
+            return None
+        
+        # Bump mtime so eviction sees this entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry, f
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Load an entry (fresh or stale), or None if not cached"""
+        opened = self.open(key)
+        if opened is None:
+            return None
+        entry, f = opened
+        with f:
+            try:
+                entry.body = json.load(f)
+            except ValueError:
+                return None
+        return entry
+    
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry can be served without revalidation"""
+        return (
+            time.time() - entry.stored_at < self.ttl
+            and entry.stored_at > self._invalidated_at()
+        )
+    
+    def set(
+        self,
+        key: str,
+        body: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Store a response body with its validators"""
+        with self.body_writer(key, etag=etag, last_modified=last_modified) as f:
+            f.write(json.dumps(body).encode())
+    
+    @contextmanager
+    def body_writer(
+        self,
+        key: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Iterator[IO[bytes]]:
+        """
+        Store a response by writing its raw JSON body bytes as they arrive
+        
+        The entry only becomes visible once the block exits cleanly; an
+        exception (or an abandoned stream) discards the partial file.
+        """
+        header = json.dumps({"stored_at": time.time(), "etag": etag, "last_modified": last_modified})
+        # Owner-only scratch file, unique per writer (thread or process)
+        f = tempfile.NamedTemporaryFile("wb", dir=self.directory, suffix=".tmp", delete=False)
+        try:
+            with f:
+                f.write(header.encode() + b"\n")
+                yield f
+        except BaseException:
+            os.unlink(f.name)
+            raise
+        self._commit(f, key)
+    
+    def _commit(self, f: IO, key: str):
+        """Publish a closed scratch file as the entry for ``key``"""
+        size = os.path.getsize(f.name)
+        try:
+            os.replace(f.name, self._path(key))
+        except OSError:
+            os.unlink(f.name)
+            raise
+        
+        with self._lock:
+            self._writes += 1
+            if self._size is not None:
+                self._size += size
+            due = self._size is None or self._size > self.max_bytes or self._writes % self.EVICT_EVERY == 0
+        if due:
+            self._evict()
+    
+    def touch(self, key: str, entry: CacheEntry):
+        """Mark an entry as just revalidated (after a 304)"""
+        opened = self.open(key)
+        if opened is None:
+            # Evicted meanwhile; only restorable if the caller loaded the body
+            if entry.body is not None:
+                self.set(key, entry.body, etag=entry.etag, last_modified=entry.last_modified)
+            return
+        with opened[1] as body, self.body_writer(key, etag=entry.etag, last_modified=entry.last_modified) as f:
+            shutil.copyfileobj(body, f)
+    
+    def invalidate(self):
+        """Force every current entry to be revalidated on next use"""
+        marker = self.directory / self.INVALIDATED_MARKER
+        marker.touch()
+        os.utime(marker)
+    
+    def clear(self):
+        """Remove every cached entry"""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+    
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                path.unlink(missing_ok=True)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        
+        with self._lock:
+            self._size = total
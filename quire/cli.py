@@ -0,0 +1,706 @@
+"""
+Unified command line: quire tasks|mine|find|search|done|task|projects|import-csv|export|daemon
+
+Usage:
+  python -m quire tasks [PROJECT_OID] [--no-cache]
+  python -m quire mine [--all] [--no-cache]
+  python -m quire find [--tag T] [--due-to DATE] [--text WORDS] [--open] [--db MIRROR]
+  python -m quire search "rtl testing" [--db MIRROR] [--project PROJECT_OID]
+  python -m quire done TASK_OID [-c "Comment"]
+  python -m quire task "Task name" [-p PROJECT_OID] [-d "Description"]
+  python -m quire projects [--no-cache]
+  python -m quire import-csv FILE.csv [-p PROJECT_OID] [--dry-run]
+  python -m quire export tasks.csv|tasks.ndjson.gz [--project PROJECT_OID]
+  python -m quire daemon start|stop|status
+  
+Heavy modules (requests, the HTTP client) are imported only by the code
+path that needs them. Read-only commands first try to render from fresh
+response cache entries, then a running daemon (see quire.daemon) is asked
+to run the command; only without one is the network client built here.
+"""
+
+import os
+import sys
+import argparse
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+
+PRIORITY_LABELS = {1: "🔴 High", 2: "🟡 Medium", 3: "🟢 Low"}
+
+
+class _CacheMiss(Exception):
+    """A cache-only read found no fresh entry"""
+
+
+class _Resolved:
+    """BatchResult look-alike for a call that already ran"""
+    
+    ok = True
+    error = None
+    
+    def __init__(self, value: Any):
+        self.value = value
+    
+    def result(self) -> Any:
+        return self.value
+
+
+class _CacheOnlyClient:
+    """
+    Read-only stand-in for QuireClient served from fresh cache entries
+    
+    Mirrors the endpoints and cache keys of the QuireClient methods the
+    read-only commands use, without importing requests or building auth.
+    Raises _CacheMiss as soon as anything would need the network.
+    """
+    
+    def __init__(self):
+        from .cache import ResponseCache, account_scope
+        
+        self.cache = ResponseCache()
+        self.api_base = os.getenv("QUIRE_API_BASE", "https://quire.io/api")
+        # Same account as the QuireAuth a network client would build
+        self.scope = account_scope(os.getenv("QUIRE_CLIENT_ID"), os.getenv("QUIRE_REFRESH_TOKEN"))
+    
+    def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        key = self.cache.key(f"{self.api_base}/{endpoint.lstrip('/')}", params, scope=self.scope)
+        entry = self.cache.get(key)
+        if entry is None or not self.cache.is_fresh(entry):
+            raise _CacheMiss(endpoint)
+        return entry.body
+    
+    def gather(self, *calls, **kwargs) -> List[_Resolved]:
+        # Cache reads are local file loads; nothing worth overlapping
+        return [_Resolved(call()) for call in calls]
+    
+    def get_current_user(self):
+        from .models import User
+        return User.from_dict(self._get("/user/id/me"))
+    
+    def list_projects(self):
+        from .models import Project
+        return [Project.from_dict(p) for p in self._get("/project/list")]
+    
+    def get_project(self, project_oid: str):
+        from .models import Project
+        return Project.from_dict(self._get(f"/project/id/{project_oid}"))
+    
+    def iter_tasks(self, project_oid: str, status: Optional[int] = None, assignee: Optional[str] = None) -> Iterator:
+        from .models import Task
+        params = {}
+        if status is not None:
+            params["status"] = status
+        if assignee:
+            params["assignee"] = assignee
+        for data in self._get(f"/project/id/{project_oid}/task/list", params):
+            yield Task.from_dict(data)
+    
+    def list_my_tasks(self, include_completed: bool = False, project_oids=None, concurrency=None, errors=None):
+        from .query import assigned_to_me
+        return assigned_to_me(self, include_completed, project_oids, concurrency, errors)
+
+
+def _load_env():
+    """Load the nearest .env above the package, as the scripts do"""
+    # dotenv (and the logging it pulls in) is only imported when there is a file to read
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        path = os.path.join(directory, ".env")
+        if os.path.isfile(path):
+            from dotenv import load_dotenv
+            load_dotenv(path)
+            return
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return
+        directory = parent
+
+
+def _make_client(args: argparse.Namespace):
+    from .cache import ResponseCache
+    from .client import QuireClient
+    
+    # Writes share the listing cache so they invalidate it
+    kwargs = {"cache": None if getattr(args, "no_cache", False) else ResponseCache()}
+    if getattr(args, "concurrency", None):
+        kwargs["pool_size"] = args.concurrency
+    return QuireClient(**kwargs)
+
+
+def _default_project(args: argparse.Namespace, out: IO[str], usage: str) -> Optional[str]:
+    project_oid = args.project_oid or args.default_project
+    if not project_oid:
+        print("❌ No project specified!", file=out)
+        print("\nOptions:", file=out)
+        print(f"  1. {usage}", file=out)
+        print("  2. Set default: echo 'QUIRE_DEFAULT_PROJECT=PROJECT_OID' >> .env", file=out)
+        print("\nList projects: quire projects", file=out)
+    return project_oid
+
+
+# Command handlers: (args, client, out) -> exit status (None means 0)
+
+def cmd_tasks(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """List pending tasks and the latest completed ones"""
+    project_oid = _default_project(args, out, "quire tasks PROJECT_OID")
+    if not project_oid:
+        return 1
+    
+    def summarize():
+        # Stream tasks; completed ones are only counted beyond the 5 shown
+        pending = []
+        done = []
+        done_count = 0
+        for task in client.iter_tasks(project_oid):
+            if not task.completed:
+                pending.append(task)
+                continue
+            done_count += 1
+            if len(done) < 5:
+                done.append(task)
+        return pending, done, done_count
+    
+    # The project and its task list are independent requests
+    project, summary = client.gather(lambda: client.get_project(project_oid), summarize)
+    pending, done, done_count = summary.result()
+    
+    print(f"\n📋 {project.result().name}\n", file=out)
+    print("=" * 80, file=out)
+    
+    if not pending and not done:
+        print("No tasks found.", file=out)
+        return None
+    
+    if pending:
+        print(f"\n⏳ Pending ({len(pending)}):\n", file=out)
+        for i, task in enumerate(pending, 1):
+            print(f"  {i}. {task.name}", file=out)
+            print(f"     OID: {task.oid}", file=out)
+            if task.priority:
+                print(f"     Priority: {PRIORITY_LABELS.get(task.priority, task.priority)}", file=out)
+            print(file=out)
+    
+    if done:
+        print(f"✅ Completed ({done_count}):\n", file=out)
+        for task in done:
+            print(f"  • {task.name}", file=out)
+    
+    print("=" * 80, file=out)
+    print("\n💡 Create task: quire task 'Task name'", file=out)
+    print("💡 Mark done: quire done TASK_OID\n", file=out)
+    return None
+
+
+def cmd_mine(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """List tasks assigned to me across all projects, by due date"""
+    import datetime
+    
+    errors: Dict[str, Exception] = {}
+    pairs = client.list_my_tasks(include_completed=args.all, project_oids=args.projects, errors=errors)
+    status = 1 if errors else None
+    
+    print("\n🙋 My tasks\n", file=out)
+    print("=" * 80, file=out)
+    for project_oid, error in errors.items():
+        print(f"⚠️  Could not fetch project {project_oid}: {error}", file=out)
+    if not pairs:
+        print("Nothing assigned to you. 🎉", file=out)
+        return status
+    
+    today = datetime.date.today().isoformat()
+    projects = {project.oid for project, _ in pairs}
+    print(f"\n{len(pairs)} task(s) in {len(projects)} project(s):\n", file=out)
+    for project, task in pairs:
+        icon = "✅" if task.completed else "⏳"
+        due = task.due[:10] if task.due else None
+        when = f"  {'⚠️ ' if due < today and not task.completed else '📅 '}{due}" if due else ""
+        print(f"  {icon} {task.name}{when}", file=out)
+        details = [f"OID: {task.oid}", f"project: {project.name}"]
+        if task.priority:
+            details.append(f"priority: {PRIORITY_LABELS.get(task.priority, task.priority)}")
+        print("     " + "  ".join(details), file=out)
+    
+    print("=" * 80, file=out)
+    print("\n💡 Mark done: quire done TASK_OID\n", file=out)
+    return status
+
+
+def cmd_find(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """Query tasks across projects from the local mirror or the API"""
+    from .query import Query, QueryPlan, TaskIndex
+    
+    query = Query(
+        projects=args.projects,
+        status=args.status,
+        priority=args.priority,
+        assignee=args.assignee,
+        tags=args.tags or [],
+        due_from=args.due_from,
+        due_to=args.due_to,
+        text=args.text,
+        completed=False if args.open else (True if args.completed else None),
+        limit=args.limit,
+    )
+    plan = QueryPlan()
+    
+    db = args.db or os.getenv("QUIRE_MIRROR_DB")
+    if db:
+        from .sync import Mirror
+        
+        with Mirror(db) as mirror:
+            index = TaskIndex.from_mirror(mirror)
+            tasks = index.find(query, plan)
+            # Descriptions are not shown, so the mirror can close now
+            rows = [(index.project_of(t), t) for t in tasks]
+        source = f"mirror {db}"
+    else:
+        client = client or _make_client(args)
+        try:
+            rows = [(None, t) for t in client.query(query, plan=plan)]
+        finally:
+            client.close()
+        source = "Quire API"
+    
+    if args.explain:
+        print(f"🧭 {source}", file=out)
+        print(str(plan), file=out)
+        print(file=out)
+    
+    for project_oid, error in plan.errors.items():
+        print(f"⚠️  Could not fetch project {project_oid}: {error}", file=out)
+    status = 1 if plan.errors else None
+    
+    if not rows:
+        print("No matching tasks.", file=out)
+        return status
+    
+    print(f"🔎 {len(rows)} task(s)\n", file=out)
+    for project_oid, task in rows:
+        icon = "✅" if task.completed else "⏳"
+        due = f"  📅 {task.due[:10]}" if task.due else ""
+        print(f"  {icon} {task.name}{due}", file=out)
+        details = [f"OID: {task.oid}"]
+        if project_oid:
+            details.append(f"project: {project_oid}")
+        if task.priority:
+            details.append(f"priority: {PRIORITY_LABELS.get(task.priority, task.priority)}")
+        if task.tags:
+            details.append("tags: " + ", ".join(task.tags))
+        print("     " + "  ".join(details), file=out)
+    return status
+
+
+def cmd_search(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """Full-text search of the local mirror"""
+    import time
+    from .sync import Mirror
+    
+    db = args.db or os.getenv("QUIRE_MIRROR_DB", Mirror.DEFAULT_PATH)
+    if not os.path.exists(db):
+        print(f"❌ No mirror at {db}", file=out)
+        print("\nCreate one first: python scripts/sync_mirror.py --comments", file=out)
+        return 1
+    
+    text = " ".join(args.words)
+    with Mirror(db) as mirror:
+        started = time.perf_counter()
+        hits = mirror.search(text, limit=args.limit, project_oid=args.project_oid, raw=args.raw)
+        elapsed = (time.perf_counter() - started) * 1000
+    
+    if not hits:
+        print(f"No tasks match {text!r}.", file=out)
+        return None
+    
+    print(f"🔎 {len(hits)} task(s) for {text!r} ({elapsed:.1f} ms)\n", file=out)
+    for i, hit in enumerate(hits, 1):
+        print(f"  {i}. {hit.name}", file=out)
+        print(f"     OID: {hit.task_oid}  project: {hit.project_oid}", file=out)
+        if hit.matched == "comment" or hit.snippet.replace("[", "").replace("]", "") != hit.name:
+            label = "comment" if hit.matched == "comment" else "text"
+            print(f"     {label}: {' '.join(hit.snippet.split())}", file=out)
+    return None
+
+
+def cmd_projects(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """List all projects"""
+    print("📋 Quire Projects\n", file=out)
+    print("=" * 80, file=out)
+    
+    user, projects = client.gather(client.get_current_user, client.list_projects)
+    user, projects = user.result(), projects.result()
+    print(f"👤 Logged in as: {user.name} ({user.email})\n", file=out)
+    
+    if not projects:
+        print("No projects found.", file=out)
+        return None
+    
+    print(f"Found {len(projects)} project(s):\n", file=out)
+    for i, project in enumerate(projects, 1):
+        status = "📦" if not project.archived else "📁"
+        print(f"{i}. {status} {project.name}", file=out)
+        print(f"   OID: {project.oid}", file=out)
+        if project.description:
+            print(f"   Description: {project.description}", file=out)
+        if project.color:
+            print(f"   Color: {project.color}", file=out)
+        print(file=out)
+    
+    print("=" * 80, file=out)
+    print("\n💡 Tip: Use the OID to list tasks in a project:", file=out)
+    print("   quire tasks <PROJECT_OID>\n", file=out)
+    return None
+
+
+def cmd_done(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """Mark a task as done, optionally with a comment"""
+    # The update response carries the task name, so no GET is needed, and
+    # the comment does not depend on the update: one round trip in total
+    calls = [lambda: client.update_task(args.task_oid, status=args.status)]
+    if args.comment:
+        calls.append(lambda: client.add_comment(args.task_oid, args.comment))
+    update, *comment = client.gather(*calls)
+    
+    if not update.ok:
+        print(f"❌ Status update failed: {update.error}", file=out)
+    else:
+        print(f"📝 Task: {update.value.name}", file=out)
+        print(f"✅ Status updated to: {args.status}", file=out)
+    
+    if comment and not comment[0].ok:
+        print(f"❌ Comment failed: {comment[0].error}", file=out)
+    elif comment:
+        print(f"💬 Comment added: {args.comment}", file=out)
+    
+    if not update.ok or (comment and not comment[0].ok):
+        return 1
+    print("\n🎉 Task marked as done!", file=out)
+    return None
+
+
+def cmd_task(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """Create a task in the default (or given) project"""
+    project_oid = _default_project(args, out, "Pass project: quire task 'Task' -p PROJECT_OID")
+    if not project_oid:
+        return 1
+    
+    task = client.create_task(
+        project_oid=project_oid,
+        name=args.name,
+        description=args.description,
+        priority=args.priority,
+        due=args.due,
+    )
+    
+    print(f"✅ Task created: {task.name}", file=out)
+    print(f"   OID: {task.oid}", file=out)
+    if task.description:
+        print(f"   Description: {task.description}", file=out)
+    
+    print("\n💡 To mark as done:", file=out)
+    print(f"   quire done {task.oid}", file=out)
+    return None
+
+
+def cmd_import_csv(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """Create one task per CSV row, resuming an interrupted import"""
+    from .importer import default_journal_path, import_csv
+    
+    project_oid = _default_project(args, out, "quire import-csv FILE.csv -p PROJECT_OID")
+    if not project_oid:
+        return 1
+    
+    columns = {}
+    for mapping in args.map or []:
+        header, sep, target = mapping.partition("=")
+        if not sep:
+            print(f"❌ --map expects COLUMN=FIELD, got {mapping!r}", file=out)
+            return 2
+        columns[header] = target
+    
+    journal = args.journal or default_journal_path(args.file)
+    if not args.dry_run:
+        print(f"📥 Importing {args.file} (journal: {journal})", file=out)
+    
+    def progress(report):
+        print(f"   {report.rows} rows: {report.created} created, {report.skipped} already done, "
+              f"{report.failed} failed", file=out, flush=True)
+    
+    report = import_csv(
+        client,
+        args.file,
+        project_oid,
+        journal_path=journal,
+        concurrency=args.concurrency,
+        columns=columns,
+        dry_run=args.dry_run,
+        on_progress=progress,
+    )
+    
+    if args.dry_run:
+        print(f"🔎 {report.rows} row(s), {report.invalid} invalid", file=out)
+    else:
+        print(f"\n✅ Created {report.created}, already done {report.skipped}, "
+              f"recovered from an interrupted run {report.reconciled}", file=out)
+    for number, error in list(report.errors.items())[:20]:
+        print(f"   ❌ row {number}: {error}", file=out)
+    if len(report.errors) > 20:
+        print(f"   ... and {len(report.errors) - 20} more", file=out)
+    if report.failed:
+        print("\n💡 Run the same command again to retry failed rows", file=out)
+    return 1 if report.errors else None
+
+
+def cmd_export(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """Write every task of the workspace (or of some projects) to a file"""
+    from .export import export_tasks, format_for, open_output
+    
+    fmt = args.format or format_for(args.output)
+    # With the export on stdout, progress goes to stderr
+    log = sys.stderr if args.output == "-" else out
+    
+    def progress(project, count, error):
+        if error is not None:
+            print(f"   ❌ {project.name}: {error}", file=log, flush=True)
+        elif args.verbose:
+            print(f"   {count:>6}  {project.name}", file=log, flush=True)
+    
+    stream = open_output(args.output)
+    try:
+        report = export_tasks(
+            client,
+            stream,
+            fmt=fmt,
+            project_oids=args.projects,
+            concurrency=args.concurrency,
+            on_project=progress,
+        )
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    
+    print(f"✅ Exported {report.tasks} task(s) from {report.projects} project(s) "
+          f"to {args.output} ({fmt}) in {report.elapsed:.1f}s", file=log)
+    if report.errors:
+        print(f"⚠️  {len(report.errors)} project(s) failed and are missing from the export", file=log)
+        return 1
+    return None
+
+
+def cmd_daemon(args: argparse.Namespace, client, out: IO[str]) -> Optional[int]:
+    """Start, stop or query the resident daemon"""
+    from . import daemon
+    
+    if args.action == "start":
+        if args.detach:
+            if not daemon.spawn():
+                print("❌ quire daemon did not start (run `quire daemon start` to see why)", file=out)
+                return 1
+            print(f"✅ quire daemon listening on {daemon.default_socket_path()}", file=out)
+            return None
+        server = daemon.QuireDaemon()
+        print(f"✅ quire daemon listening on {server.path} (Ctrl+C to stop)", file=out)
+        out.flush()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return None
+    
+    reply = daemon.request({"op": "ping" if args.action == "status" else "shutdown"})
+    if reply is None:
+        print("💤 quire daemon is not running", file=out)
+        return 1 if args.action == "status" else None
+    if args.action == "status":
+        print(f"✅ quire daemon pid {reply['pid']}, up {reply['uptime']:.0f}s, "
+              f"{reply['served']} command(s) served", file=out)
+        if reply.get("background_failures"):
+            print(f"⚠️  {reply['background_failures']} background command(s) failed, "
+                  f"see {daemon.background_log_path()}", file=out)
+    else:
+        out.write(reply.get("output", ""))
+    return None
+
+
+def _run_in_background(argv: List[str], args: argparse.Namespace) -> int:
+    """Hand a command to the daemon, or a detached process, without waiting for it"""
+    argv = [arg for arg in argv if arg != "--no-wait"]
+    
+    if not args.direct:
+        from .daemon import run_via_daemon
+        
+        try:
+            reply = run_via_daemon(argv, args.default_project, wait=False)
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return 1
+        if reply is not None:
+            sys.stdout.write(reply.get("output", ""))
+            return reply.get("status", 1)
+    
+    import subprocess
+    from .daemon import background_log_path
+    
+    log_path = background_log_path()
+    os.makedirs(os.path.dirname(log_path), mode=0o700, exist_ok=True)
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ}
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (package_parent, env.get("PYTHONPATH")) if p)
+    with open(log_path, "a", encoding="utf-8") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "quire", "--direct", *[a for a in argv if a != "--direct"]],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+    print(f"📨 Running in the background (output: {log_path})")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="quire", description="Quire task management")
+    parser.add_argument("--direct", action="store_true", help="Run here even if a daemon is running")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+    
+    # cached=True: the command only reads, so it may be served from the cache alone
+    tasks = commands.add_parser("tasks", help="List pending and recently completed tasks")
+    tasks.add_argument("project_oid", nargs="?", help="Project OID (default: QUIRE_DEFAULT_PROJECT)")
+    tasks.add_argument("--no-cache", action="store_true", help="Bypass the local response cache")
+    tasks.set_defaults(handler=cmd_tasks, cached=True)
+    
+    mine = commands.add_parser("mine", help="List tasks assigned to me across all projects")
+    mine.add_argument("--all", action="store_true", help="Include completed tasks")
+    mine.add_argument("--project", action="append", dest="projects", help="Only this project OID (repeatable)")
+    mine.add_argument("--no-cache", action="store_true", help="Bypass the local response cache")
+    mine.set_defaults(handler=cmd_mine, cached=True)
+    
+    # local=True: reads the mirror directly, or builds its own client for the API
+    find = commands.add_parser("find", help="Query tasks across projects (tag, due range, priority, text...)")
+    find.add_argument("--project", action="append", dest="projects", help="Limit to this project OID (repeatable)")
+    find.add_argument("--status", type=int, help="Status code")
+    find.add_argument("--priority", type=int, help="Priority (1=high, 2=medium, 3=low)")
+    find.add_argument("--assignee", help="Assignee OID (or name, with --db)")
+    find.add_argument("--tag", action="append", dest="tags", help="Required tag (repeatable)")
+    find.add_argument("--due-from", help="Due on or after YYYY-MM-DD")
+    find.add_argument("--due-to", help="Due on or before YYYY-MM-DD")
+    find.add_argument("--text", help="Words in the task name")
+    state = find.add_mutually_exclusive_group()
+    state.add_argument("--open", action="store_true", help="Only tasks not done")
+    state.add_argument("--completed", action="store_true", help="Only completed tasks")
+    find.add_argument("--limit", type=int, help="Show at most this many tasks")
+    find.add_argument("--db", help="Query this mirror database instead of the API (default: QUIRE_MIRROR_DB)")
+    find.add_argument("--no-cache", action="store_true", help="Bypass the local response cache")
+    find.add_argument("--explain", action="store_true", help="Show the query plan and timing")
+    find.set_defaults(handler=cmd_find, cached=False, local=True)
+    
+    search = commands.add_parser("search", help="Full-text search of task names, descriptions and comments")
+    search.add_argument("words", nargs="+", help="Words to find (all must match; prefixes match too)")
+    search.add_argument("-p", "--project", dest="project_oid", help="Only search this project OID")
+    search.add_argument("--limit", type=int, default=20, help="Max results (default: 20)")
+    search.add_argument("--raw", action="store_true", help="Use SQLite FTS5 query syntax (AND/OR/NOT, \"phrases\")")
+    search.add_argument("--db", help="Mirror database (default: QUIRE_MIRROR_DB or quire_mirror.db)")
+    search.set_defaults(handler=cmd_search, cached=False, local=True)
+    
+    projects = commands.add_parser("projects", help="List all projects")
+    projects.add_argument("--no-cache", action="store_true", help="Bypass the local response cache")
+    projects.set_defaults(handler=cmd_projects, cached=True)
+    
+    done = commands.add_parser("done", help="Mark a task as done")
+    done.add_argument("task_oid", help="Task OID")
+    done.add_argument("-c", "--comment", help="Completion comment")
+    done.add_argument("-s", "--status", type=int, default=10, help="Status code (default: 10=Done)")
+    done.add_argument("--no-wait", action="store_true",
+                      help="Return immediately; the daemon (or a background process) does the update")
+    done.set_defaults(handler=cmd_done, cached=False)
+    
+    task = commands.add_parser("task", help="Create a task")
+    task.add_argument("name", help="Task name")
+    task.add_argument("-p", "--project", dest="project_oid", help="Project OID (or set QUIRE_DEFAULT_PROJECT)")
+    task.add_argument("-d", "--description", help="Task description")
+    task.add_argument("--priority", type=int, help="Priority (1=high, 2=medium, 3=low)")
+    task.add_argument("--due", help="Due date (YYYY-MM-DD)")
+    task.set_defaults(handler=cmd_task, cached=False)
+    
+    # forward=False: reads local files and reports progress, so it always runs here
+    import_csv = commands.add_parser("import-csv", help="Create tasks from a CSV file (resumable)")
+    import_csv.add_argument("file", help="CSV file with a header row (e.g. quire_tasks_import.csv)")
+    import_csv.add_argument("-p", "--project", dest="project_oid", help="Project OID (or set QUIRE_DEFAULT_PROJECT)")
+    import_csv.add_argument("--journal", help="Progress journal (default: FILE.journal)")
+    import_csv.add_argument("--concurrency", type=int, default=8, help="Parallel creates (default: 8)")
+    import_csv.add_argument("--map", action="append", metavar="COLUMN=FIELD",
+                            help="Map a CSV column to name/description/priority/tags/due/start/status/assignee")
+    import_csv.add_argument("--dry-run", action="store_true", help="Only check that every row maps to a task")
+    import_csv.set_defaults(handler=cmd_import_csv, cached=False, forward=False)
+    
+    export = commands.add_parser("export", help="Export all tasks to CSV or NDJSON")
+    export.add_argument("output", help="Output file (.csv, .ndjson, optionally .gz; '-' for stdout)")
+    export.add_argument("--format", choices=["csv", "ndjson"], help="Output format (default: from the file name)")
+    export.add_argument("--project", action="append", dest="projects", help="Only export this project OID (repeatable)")
+    export.add_argument("--concurrency", type=int, default=8, help="Parallel project fetches (default: 8)")
+    export.add_argument("--no-cache", action="store_true", help="Bypass the local response cache")
+    export.add_argument("-v", "--verbose", action="store_true", help="Print each project as it is written")
+    export.set_defaults(handler=cmd_export, cached=False, forward=False)
+    
+    # local=True: runs without a client, never forwarded to the daemon
+    daemon = commands.add_parser("daemon", help="Keep a warm client running for fast commands")
+    daemon.add_argument("action", choices=["start", "stop", "status"])
+    daemon.add_argument("--detach", action="store_true", help="Start in the background")
+    daemon.set_defaults(handler=cmd_daemon, cached=False, local=True)
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    args = build_parser().parse_args(argv)
+    _load_env()
+    args.default_project = os.getenv("QUIRE_DEFAULT_PROJECT")
+    
+    if getattr(args, "local", False):
+        try:
+            return args.handler(args, None, sys.stdout) or 0
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return 1
+    
+    if args.cached and not args.no_cache:
+        # Buffer the output: on a miss nothing is printed and the command reruns
+        from io import StringIO
+        
+        out = StringIO()
+        try:
+            status = args.handler(args, _CacheOnlyClient(), out)
+        except Exception:
+            # A miss (or an unreadable entry) falls through to the network
+            pass
+        else:
+            sys.stdout.write(out.getvalue())
+            return status or 0
+    
+    if getattr(args, "no_wait", False):
+        return _run_in_background(argv, args)
+    
+    if not args.direct and getattr(args, "forward", True):
+        from .daemon import run_via_daemon
+        
+        try:
+            reply = run_via_daemon(argv, args.default_project)
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return 1
+        if reply is not None:
+            sys.stdout.write(reply.get("output", ""))
+            return reply.get("status", 1)
+    
+    client = None
+    try:
+        client = _make_client(args)
+        return args.handler(args, client, sys.stdout) or 0
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+    finally:
+        if client is not None:
+            client.close()
@@ -4,18 +4,56 @@ Main Quire API client
 
 import os
 import requests
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from .auth import QuireAuth
-from .models import Project, Task, User, Comment
+from .cache import ResponseCache
+from .coalesce import CoalesceStats, SingleFlight
+from .models import CompactTask, Project, Task, User, Comment
+from .ratelimit import RateLimiter, ThrottleStats
+from .stream import iter_json_array
+
+if TYPE_CHECKING:
+    from .query import Query, QueryPlan, TaskIndex
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single call in a batch, kept at its input position"""
+    index: int
+    value: Any = None
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+    
+    def result(self) -> Any:
+        """The value, or raise the call's exception"""
+        if self.error is not None:
+            raise self.error
+        return self.value
 
 
 class QuireClient:
     """Main client for interacting with Quire API"""
     
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_TIMEOUT = 30.0
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
     def __init__(
         self,
         auth: Optional[QuireAuth] = None,
         api_base: Optional[str] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
     ):
         """
         Initialize Quire API client
@@ -23,9 +61,209 @@ class QuireClient:
         Args:
             auth: QuireAuth instance (creates new one if not provided)
             api_base: API base URL (default: https://quire.io/api)
+            pool_size: Max keep-alive connections kept open to the API host
+            timeout: Per-request timeout in seconds (None waits forever)
+            rate_limiter: Request pacer/retry policy, shareable between clients
+                (default: retries only, paced at QUIRE_RATE_LIMIT req/s if set)
+            cache: On-disk cache for GET responses (default: no caching)
+            coalesce: Share one request between threads making the same GET
+                at the same time (see coalesce_stats)
         """
         self.auth = auth or QuireAuth()
         self.api_base = api_base or os.getenv("QUIRE_API_BASE", "https://quire.io/api")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter or RateLimiter(
+            rate=float(os.getenv("QUIRE_RATE_LIMIT", 0)) or None
+        )
+        self.cache = cache
+        self._inflight = SingleFlight() if coalesce else None
+        self.session = self._create_session(pool_size)
+    
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """Create a keep-alive session with a connection pool of the given size"""
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        
+        # pool_block makes extra threads wait for a free connection instead
+        # of opening throwaway ones, so the pool also caps requests in flight
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Content-Type"] = "application/json"
+        return session
+    
+    @property
+    def throttle_stats(self) -> ThrottleStats:
+        """Time and retries spent on rate limiting so far"""
+        return self.rate_limiter.stats
+    
+    @property
+    def coalesce_stats(self) -> CoalesceStats:
+        """GETs made so far and how many were answered by an identical in-flight one"""
+        return self._inflight.stats if self._inflight is not None else CoalesceStats()
+    
+    def close(self):
+        """Close pooled connections held by the client"""
+        self.session.close()
+    
+    def __enter__(self) -> "QuireClient":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _run_batch(
+        self,
+        calls: List[Callable[[], Any]],
+        concurrency: Optional[int] = None,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> List[BatchResult]:
+        """
+        Run zero-argument calls concurrently with bounded parallelism
+        
+        Args:
+            calls: Callables to run
+            concurrency: Max calls in flight (default: pool size)
+            on_result: Called with each BatchResult as soon as it completes
+            timeout: Seconds to wait for the whole batch; calls not finished by
+                then get a TimeoutError (queued ones are cancelled, running ones
+                are abandoned and end at the request timeout)
+                
+        Returns:
+            One BatchResult per call, in input order
+        """
+        results: List[Optional[BatchResult]] = [None] * len(calls)
+        if not calls:
+            return []
+        
+        workers = max(1, min(concurrency or self.pool_size, len(calls)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="quire-batch")
+        timed_out = False
+        try:
+            futures = {executor.submit(call): i for i, call in enumerate(calls)}
+            try:
+                for future in as_completed(futures, timeout=timeout):
+                    index = futures[future]
+                    try:
+                        result = BatchResult(index, value=future.result())
+                    except Exception as e:
+                        result = BatchResult(index, error=e)
+                    results[index] = result
+                    if on_result:
+                        on_result(result)
+            except FuturesTimeoutError:
+                timed_out = True
+                for future, index in futures.items():
+                    if results[index] is None:
+                        future.cancel()
+                        results[index] = BatchResult(
+                            index, error=TimeoutError(f"Not finished within {timeout:g}s")
+                        )
+                        if on_result:
+                            on_result(results[index])
+        finally:
+            executor.shutdown(wait=not timed_out, cancel_futures=True)
+        
+        return results
+    
+    def gather(
+        self,
+        *calls: Callable[[], Any],
+        concurrency: Optional[int] = None,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> List[BatchResult]:
+        """
+        Run independent client calls concurrently
+        
+        Calls can be any mix of methods; wrap each in a lambda or
+        functools.partial. A failing call does not affect the others.
+        
+        Example:
+            project, tasks = client.gather(
+                lambda: client.get_project(oid),
+                lambda: client.list_tasks(oid),
+            )
+            print(project.result().name, len(tasks.result()))
+            
+        Args:
+            calls: Zero-argument callables
+            concurrency: Max calls in flight (default: pool size)
+            on_result: Called with each BatchResult as soon as it completes
+            timeout: Overall time budget in seconds; unfinished calls get a TimeoutError
+            
+        Returns:
+            One BatchResult per call, in argument order
+        """
+        return self._run_batch(list(calls), concurrency=concurrency, on_result=on_result, timeout=timeout)
+    
+    def _url(self, endpoint: str) -> str:
+        return f"{self.api_base}/{endpoint.lstrip('/')}"
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        Send an authenticated request, pacing and retrying per the rate limiter
+        
+        A 401 is replayed once after refreshing the access token.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (without base URL)
+            data: JSON body for POST/PUT
+            params: URL query parameters
+            headers: Extra request headers
+            stream: Defer downloading the response body
+            
+        Returns:
+            Successful (non-error) response
+        """
+        url = self._url(endpoint)
+        
+        attempt = 0
+        reauthenticated = False
+        while True:
+            self.rate_limiter.acquire()
+            token = self.auth.get_valid_access_token()
+            response = self.session.request(
+                method=method,
+                url=url,
+                headers={"Authorization": f"Bearer {token}", **(headers or {})},
+                json=data,
+                params=params,
+                timeout=self.timeout,
+                stream=stream,
+            )
+            
+            # A revoked or expired token is rejected before the request is
+            # processed, so replaying once with a fresh token is always safe
+            if response.status_code == 401 and not reauthenticated:
+                response.close()
+                self.auth.force_refresh(token)
+                reauthenticated = True
+                continue
+            
+            delay = self.rate_limiter.retry_delay(method, response, attempt)
+            if delay is None:
+                break
+            
+            response.close()
+            self.rate_limiter.wait_before_retry(delay, throttled=response.status_code == 429)
+            attempt += 1
+        
+        response.raise_for_status()
+        return response
     
     def _request(
         self,
@@ -46,23 +284,91 @@ class QuireClient:
         Returns:
             JSON response
         """
-        url = f"{self.api_base}/{endpoint.lstrip('/')}"
-        headers = {
-            **self.auth.get_auth_headers(),
-            "Content-Type": "application/json",
-        }
-        
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=data,
-            params=params,
-        )
+        if method == "GET":
+            if self._inflight is None:
+                return self._get(endpoint, params)
+            key = (endpoint, tuple(sorted((params or {}).items())))
+            return self._inflight.do(key, lambda: self._get(endpoint, params))
+        
+        response = self._send(method, endpoint, data=data, params=params)
+        
+        # Any write may change cached listings, so revalidate them next time
+        if self.cache is not None:
+            self.cache.invalidate()
         
-        response.raise_for_status()
         return response.json()
     
+    def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        if self.cache is not None:
+            return self._cached_get(endpoint, params)
+        return self._send("GET", endpoint, params=params).json()
+    
+    def _iter_list(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[Any]:
+        """GET a JSON array endpoint and yield its elements while streaming"""
+        if self.cache is None:
+            with self._send("GET", endpoint, params=params, stream=True) as response:
+                yield from iter_json_array(response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE))
+            return
+        
+        # Cached bodies are streamed from disk too, never loaded whole
+        key = self.cache.key(self._url(endpoint), params, scope=self.auth.account)
+        entry, cached = self.cache.open(key) or (None, None)
+        try:
+            if entry is not None and self.cache.is_fresh(entry):
+                yield from iter_json_array(self._read_chunks(cached))
+                return
+            
+            headers = entry.validators() if entry is not None else None
+            with self._send("GET", endpoint, params=params, headers=headers, stream=True) as response:
+                if response.status_code == 304 and entry is not None:
+                    self.cache.touch(key, entry)
+                    yield from iter_json_array(self._read_chunks(cached))
+                    return
+                
+                # Spool raw bytes into the cache as they stream past the parser
+                with self.cache.body_writer(
+                    key,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                ) as body:
+                    chunks = response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE)
+                    yield from iter_json_array(self._tee(chunks, body))
+        finally:
+            if cached is not None:
+                cached.close()
+    
+    def _read_chunks(self, f) -> Iterator[bytes]:
+        return iter(lambda: f.read(self.STREAM_CHUNK_SIZE), b"")
+    
+    @staticmethod
+    def _tee(chunks: Iterable[bytes], sink) -> Iterator[bytes]:
+        for chunk in chunks:
+            sink.write(chunk)
+            yield chunk
+    
+    def _cached_get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """GET through the response cache, revalidating stale entries"""
+        key = self.cache.key(self._url(endpoint), params, scope=self.auth.account)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            return entry.body
+        
+        headers = entry.validators() if entry is not None else None
+        response = self._send("GET", endpoint, params=params, headers=headers)
+        
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(key, entry)
+            return entry.body
+        
+        body = response.json()
+        self.cache.set(
+            key,
+            body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return body
+    
     # User methods
     
     def get_current_user(self) -> User:
@@ -92,6 +398,15 @@ class QuireClient:
     
     # Task methods
     
+    @staticmethod
+    def _task_filters(status: Optional[int], assignee: Optional[str]) -> Dict[str, Any]:
+        params = {}
+        if status is not None:
+            params["status"] = status
+        if assignee:
+            params["assignee"] = assignee
+        return params
+    
     def list_tasks(
         self,
         project_oid: str,
@@ -109,15 +424,133 @@ class QuireClient:
         Returns:
             List of Task instances
         """
-        params = {}
-        if status is not None:
-            params["status"] = status
-        if assignee:
-            params["assignee"] = assignee
-        
+        params = self._task_filters(status, assignee)
         data = self._request("GET", f"/project/id/{project_oid}/task/list", params=params)
         return [Task.from_dict(t) for t in data]
     
+    def iter_tasks(
+        self,
+        project_oid: str,
+        status: Optional[int] = None,
+        assignee: Optional[str] = None,
+        compact: bool = False,
+    ) -> Iterator[Union[Task, CompactTask]]:
+        """
+        Iterate over tasks in a project as the response downloads
+        
+        Unlike list_tasks, the body is decoded incrementally and each Task is
+        yielded as soon as it is parsed, so memory stays flat for huge
+        projects. With a response cache, cached bodies are reused and new
+        ones are spooled to disk while streaming.
+        
+        Args:
+            project_oid: Project OID
+            status: Filter by status code (optional)
+            assignee: Filter by assignee OID (optional)
+            compact: Yield slotted CompactTask objects instead of Task
+            
+        Yields:
+            Task (or CompactTask) instances, in API order
+        """
+        model = CompactTask if compact else Task
+        for data in self.iter_task_payloads(project_oid, status=status, assignee=assignee):
+            yield model.from_dict(data)
+    
+    def iter_task_payloads(
+        self,
+        project_oid: str,
+        status: Optional[int] = None,
+        assignee: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the raw API payloads of a project's tasks as they download
+        
+        Streams like iter_tasks (cached bodies are read from disk), for
+        callers that store or forward the payloads unchanged.
+        """
+        params = self._task_filters(status, assignee)
+        return self._iter_list(f"/project/id/{project_oid}/task/list", params=params)
+    
+    def query(
+        self,
+        query: Optional["Query"] = None,
+        index: Optional["TaskIndex"] = None,
+        concurrency: Optional[int] = None,
+        plan: Optional["QueryPlan"] = None,
+        **filters: Any,
+    ) -> List[Task]:
+        """
+        Find tasks across projects
+        
+        Without an ``index``, the task lists of the query's projects (default:
+        all) are fetched concurrently with the filters the API supports
+        (status, assignee OID) pushed down, and the rest is evaluated
+        locally. With an index (e.g. TaskIndex.from_mirror), nothing is
+        fetched and the query takes milliseconds.
+        
+        Example:
+            tasks = client.query(tags=["backend"], due_to="2025-12-31", completed=False)
+            
+        Args:
+            query: quire.query.Query, or give its fields as keyword arguments
+            index: Local TaskIndex to query instead of the API
+            concurrency: Max project fetches in flight (default: pool size)
+            plan: QueryPlan to fill in with how the query was evaluated
+            
+        Returns:
+            Matching tasks by due date (undated last), then name. Projects
+            that cannot be fetched are left out and listed in ``plan.errors``.
+        """
+        from .query import Query, QueryPlan, TaskIndex
+        
+        query = query or Query(**filters)
+        plan = plan if plan is not None else QueryPlan()
+        if index is None:
+            project_oids = query.projects or [p.oid for p in self.list_projects()]
+            plan.pushdown = query.remote_filters()
+            calls = [
+                lambda oid=oid: self.list_tasks(oid, **plan.pushdown)
+                for oid in project_oids
+            ]
+            results = self._run_batch(calls, concurrency=concurrency)
+            records = []
+            for oid, result in zip(project_oids, results):
+                if not result.ok:
+                    plan.errors[oid] = result.error
+                    continue
+                records.extend((oid, task) for task in result.value)
+            index = TaskIndex(records)
+        return index.find(query, plan)
+    
+    def list_my_tasks(
+        self,
+        include_completed: bool = False,
+        project_oids: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+        errors: Optional[Dict[str, Exception]] = None,
+    ) -> List[Tuple[Project, Task]]:
+        """
+        Tasks assigned to the current user across all projects
+        
+        Resolves the user, then lists every project's tasks filtered by
+        assignee concurrently (fresh response cache entries are served
+        without a request) and merges the per-project lists by due date.
+        A project that cannot be fetched does not stop the others.
+        
+        Args:
+            include_completed: Also return completed tasks
+            project_oids: Only these projects (default: all non-archived)
+            concurrency: Max project fetches in flight (default: pool size)
+            errors: Filled in with {project OID: exception} for projects
+                whose tasks could not be fetched (they are left out)
+            
+        Returns:
+            (Project, Task) pairs by due date (undated last), then name
+        """
+        from .query import assigned_to_me
+        
+        return assigned_to_me(self, include_completed, project_oids, concurrency, errors)
+    
     def get_task(self, task_oid: str) -> Task:
         """
         Get task by OID
@@ -180,6 +613,34 @@ class QuireClient:
         data = self._request("POST", f"/project/id/{project_oid}/task", data=task_data)
         return Task.from_dict(data)
     
+    def create_tasks(
+        self,
+        project_oid: str,
+        specs: Iterable[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
+    ) -> List[BatchResult]:
+        """
+        Create many tasks concurrently
+        
+        A failed create does not stop the others; check ``result.ok`` and
+        ``result.error`` for each item.
+        
+        Args:
+            project_oid: Project OID to create tasks in
+            specs: Keyword arguments for create_task, one dict per task
+            concurrency: Max creates in flight (default: pool size)
+            on_result: Called with each BatchResult as soon as it completes
+            
+        Returns:
+            One BatchResult per spec, in input order, with the created Task as value
+        """
+        calls = [
+            lambda spec=spec: self.create_task(project_oid, **spec)
+            for spec in specs
+        ]
+        return self._run_batch(calls, concurrency=concurrency, on_result=on_result)
+    
     def update_task(
         self,
         task_oid: str,
@@ -0,0 +1,95 @@
+"""
+In-flight request coalescing
+
+When several callers ask for the same resource at the same moment, only
+the first (the leader) performs the call; the others wait for it and get
+the same result, or the same exception. Once the call finishes, the next
+request for that key goes upstream again, so nothing is cached beyond
+the lifetime of one call.
+
+The result itself is shared, not copied: copying a large task list for
+every waiter would cost more than the request saved. Coalesce calls that
+return decoded payloads and treat those as read-only; build models from
+them per caller (as the clients do) so nothing mutable is shared.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class CoalesceStats:
+    """Counters of identical concurrent calls merged into one"""
+    calls: int = 0
+    upstream: int = 0
+    
+    @property
+    def saved(self) -> int:
+        """Calls answered by another caller's in-flight request"""
+        return self.calls - self.upstream
+
+
+class _Flight:
+    __slots__ = ("done", "value", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Thread-safe coalescing of concurrent calls with equal keys"""
+    
+    def __init__(self):
+        self.stats = CoalesceStats()
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+    
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn``, or wait for the identical call already in flight"""
+        with self._lock:
+            self.stats.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.stats.upstream += 1
+        
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        
+        try:
+            flight.value = fn()
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlight:
+    """Coalescing of concurrent coroutine calls with equal keys (one event loop)"""
+    
+    def __init__(self):
+        self.stats = CoalesceStats()
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+    
+    async def do(self, key: Hashable, make: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``make()``, or the identical call already in flight"""
+        self.stats.calls += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            self.stats.upstream += 1
+            flight = self._flights[key] = asyncio.ensure_future(make())
+            flight.add_done_callback(lambda _: self._flights.pop(key, None))
+        # A cancelled waiter must not cancel the call the others are waiting on
+        return await asyncio.shield(flight)
@@ -0,0 +1,272 @@
+"""
+Resident process serving CLI commands over a Unix domain socket
+
+The daemon keeps one authenticated QuireClient (warm token, keep-alive
+connections, response cache) and runs CLI command handlers on behalf of
+`quire` invocations, which then only pay interpreter startup and one local
+round trip. The client side of this module imports nothing beyond the
+standard library.
+
+Protocol: one JSON line per connection each way.
+  request:  {"op": "run", "argv": [...], "default_project": ..., "wait": true}
+            {"op": "ping"} | {"op": "shutdown"}
+  reply:    {"status": 0, "output": "..."}
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from typing import Any, Dict, List, Optional, Tuple
+
+
+CONNECT_TIMEOUT = 0.5
+
+# argparse writes usage and errors to the process-wide stdout/stderr
+_parse_lock = threading.Lock()
+
+
+def default_socket_path() -> str:
+    """QUIRE_DAEMON_SOCKET, else quire.sock in XDG_RUNTIME_DIR or ~/.cache/quire"""
+    path = os.getenv("QUIRE_DAEMON_SOCKET")
+    if path:
+        return os.path.expanduser(path)
+    directory = os.getenv("XDG_RUNTIME_DIR") or os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "quire"
+    )
+    return os.path.join(directory, "quire.sock")
+
+
+def background_log_path() -> str:
+    """Where commands run without waiting record their output"""
+    return os.path.join(os.path.dirname(default_socket_path()), "quire-background.log")
+
+
+def request(message: Dict[str, Any], path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to a running daemon
+    
+    Returns:
+        The reply, or None if no daemon is listening (the caller should then
+        run the command itself)
+        
+    Raises:
+        ConnectionError: If the daemon accepted the request but died before
+            replying; the command may or may not have run, so it is not retried
+    """
+    path = path or default_socket_path()
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    
+    with sock:
+        sock.settimeout(None)
+        sock.sendall(json.dumps(message).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    
+    if not line:
+        raise ConnectionError("quire daemon closed the connection without replying")
+    return json.loads(line)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            reply = self.server.daemon.handle(json.loads(line))
+        except Exception as e:
+            reply = {"status": 1, "output": f"❌ Error: {e}\n"}
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class QuireDaemon:
+    """
+    Serve CLI commands from one long-lived, pre-authenticated client
+    
+    The access token is renewed in the background (TokenRenewer), so
+    commands never wait on the token endpoint either.
+    """
+    
+    def __init__(self, path: Optional[str] = None, renew_lead_time: float = 600.0):
+        """
+        Initialize daemon
+        
+        Args:
+            path: Socket path (default: default_socket_path())
+            renew_lead_time: Seconds before expiry to refresh the access token
+        """
+        from .auth import QuireAuth
+        from .cache import ResponseCache
+        from .client import QuireClient
+        
+        self.path = path or default_socket_path()
+        self.auth = QuireAuth()
+        self.client = QuireClient(auth=self.auth, cache=ResponseCache())
+        self._uncached_client: Optional[QuireClient] = None
+        self._client_lock = threading.Lock()
+        self.renewer = self.auth.start_renewer(lead_time=renew_lead_time)
+        
+        self.started_at = time.time()
+        self.served = 0
+        self.background_failures = 0
+        self._counter_lock = threading.Lock()
+        self._server: Optional[_Server] = None
+    
+    def _client_for(self, no_cache: bool):
+        if not no_cache:
+            return self.client
+        with self._client_lock:
+            if self._uncached_client is None:
+                from .client import QuireClient
+                self._uncached_client = QuireClient(auth=self.auth)
+            return self._uncached_client
+    
+    def handle(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one protocol message"""
+        op = message.get("op")
+        if op == "ping":
+            return {
+                "status": 0,
+                "pid": os.getpid(),
+                "uptime": time.time() - self.started_at,
+                "served": self.served,
+                "background_failures": self.background_failures,
+            }
+        if op == "shutdown":
+            # shutdown() waits for serve_forever to return, so not from its own thread
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+            return {"status": 0, "output": "🛑 quire daemon stopping\n"}
+        if op != "run":
+            return {"status": 2, "output": f"❌ Unknown daemon request: {op!r}\n"}
+        
+        from .cli import build_parser
+        
+        # Bad arguments and --help end in SystemExit, which must not take the
+        # handler thread down without a reply
+        captured = StringIO()
+        try:
+            with _parse_lock, redirect_stdout(captured), redirect_stderr(captured):
+                args = build_parser().parse_args(message["argv"])
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                return {"status": 1, "output": captured.getvalue() + e.code + "\n"}
+            return {"status": e.code or 0, "output": captured.getvalue()}
+        args.default_project = message.get("default_project")
+        
+        if message.get("wait", True):
+            status, output = self._run(args)
+            return {"status": status, "output": output}
+        
+        threading.Thread(target=self._run_in_background, args=(args,), daemon=True).start()
+        return {"status": 0, "output": f"📨 Sent to the quire daemon (failures go to {background_log_path()})\n"}
+    
+    def _run(self, args) -> Tuple[int, str]:
+        out = StringIO()
+        try:
+            status = args.handler(args, self._client_for(getattr(args, "no_cache", False)), out) or 0
+        except Exception as e:
+            print(f"❌ Error: {e}", file=out)
+            status = 1
+        
+        with self._counter_lock:
+            self.served += 1
+        return status, out.getvalue()
+    
+    def _run_in_background(self, args):
+        status, output = self._run(args)
+        if status:
+            with self._counter_lock:
+                self.background_failures += 1
+            with open(background_log_path(), "a", encoding="utf-8") as log:
+                log.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] quire {args.command} failed:\n{output}")
+    
+    def serve_forever(self):
+        """Listen on the socket until a shutdown request (or Ctrl+C)"""
+        if request({"op": "ping"}, self.path) is not None:
+            raise RuntimeError(f"A quire daemon is already listening on {self.path}")
+        if os.path.exists(self.path):
+            # Left behind by a daemon that did not exit cleanly
+            os.unlink(self.path)
+        
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _Server(self.path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self._server.daemon = self
+        
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            self.close()
+    
+    def close(self):
+        self.renewer.stop(timeout=1)
+        self.client.close()
+        if self._uncached_client is not None:
+            self._uncached_client.close()
+
+
+def spawn(path: Optional[str] = None, wait: float = 5.0) -> bool:
+    """
+    Start a daemon in the background and wait until it answers
+    
+    Returns:
+        True once the daemon is up, False if it did not come up within ``wait`` seconds
+    """
+    import subprocess
+    
+    path = path or default_socket_path()
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "QUIRE_DAEMON_SOCKET": path}
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (package_parent, env.get("PYTHONPATH")) if p)
+    
+    subprocess.Popen(
+        [sys.executable, "-m", "quire", "daemon", "start"],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if request({"op": "ping"}, path) is not None:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def run_via_daemon(
+    argv: List[str],
+    default_project: Optional[str],
+    wait: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """Run CLI arguments in a running daemon; None if there is none"""
+    return request({"op": "run", "argv": argv, "default_project": default_project, "wait": wait})
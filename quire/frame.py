@@ -0,0 +1,341 @@
+"""
+Columnar task container for bulk analytics (requires numpy)
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    raise ImportError("quire.frame requires numpy: pip install numpy") from None
+
+from .models import CompactTask, Task
+
+
+# Sentinels for missing values in integer columns
+NO_DATE = 0           # date ordinals start at 1 (0001-01-01)
+NO_VALUE = -32768     # status / priority
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Group keys: one group per row vs one group per assigned value
+SCALAR_KEYS = ("status", "priority", "project", "completed")
+MULTI_KEYS = ("assignee", "tag")
+
+
+def _date_ordinals(values: List[Optional[str]]) -> np.ndarray:
+    """Vectorized ISO date/datetime strings -> proleptic ordinals (NO_DATE if missing)"""
+    days = np.array([v[:10] if v else None for v in values], dtype="datetime64[D]")
+    missing = np.isnat(days)
+    ordinals = days.astype(np.int64) + _EPOCH_ORDINAL
+    ordinals[missing] = NO_DATE
+    return ordinals.astype(np.int32)
+
+
+def _to_ordinal(day: Union[date, str, int, None]) -> int:
+    if day is None:
+        return date.today().toordinal()
+    if isinstance(day, int):
+        return day
+    if isinstance(day, str):
+        day = date.fromisoformat(day[:10])
+    return day.toordinal()
+
+
+class _Vocabulary:
+    """Assigns dense integer codes to string labels"""
+    
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.labels: List[str] = []
+    
+    def code(self, label: str) -> int:
+        code = self.codes.get(label)
+        if code is None:
+            code = self.codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+
+class TaskFrame:
+    """
+    Tasks stored column-wise in NumPy arrays
+    
+    Scalar fields are one array per column. Assignees and tags are stored
+    as (row, code) pair arrays against a label vocabulary, so multi-valued
+    group-bys are a single ``np.bincount``. Filters are boolean masks.
+    """
+    
+    def __init__(
+        self,
+        oids: np.ndarray,
+        status: np.ndarray,
+        priority: np.ndarray,
+        due: np.ndarray,
+        start: np.ndarray,
+        completed: np.ndarray,
+        completed_on: np.ndarray,
+        project: np.ndarray,
+        project_labels: List[str],
+        assignee_rows: np.ndarray,
+        assignee_codes: np.ndarray,
+        assignee_labels: List[str],
+        tag_rows: np.ndarray,
+        tag_codes: np.ndarray,
+        tag_labels: List[str],
+        assignee_names: Optional[Dict[str, str]] = None,
+    ):
+        self.oids = oids
+        self.status = status
+        self.priority = priority
+        self.due = due
+        self.start = start
+        self.completed = completed
+        self.completed_on = completed_on
+        self.project = project
+        self.project_labels = project_labels
+        self.assignee_rows = assignee_rows
+        self.assignee_codes = assignee_codes
+        self.assignee_labels = assignee_labels
+        self.tag_rows = tag_rows
+        self.tag_codes = tag_codes
+        self.tag_labels = tag_labels
+        self.assignee_names = assignee_names or {}
+    
+    # Construction
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple[Optional[str], Dict[str, Any]]]) -> "TaskFrame":
+        """Build from (project OID, raw task payload) pairs"""
+        oids, status, priority, due, start, toggled, project = [], [], [], [], [], [], []
+        assignee_rows, assignee_codes, tag_rows, tag_codes = [], [], [], []
+        projects, assignees, tags = _Vocabulary(), _Vocabulary(), _Vocabulary()
+        names: Dict[str, str] = {}
+        
+        for row, (project_oid, data) in enumerate(records):
+            oids.append(data.get("oid", ""))
+            value = data.get("status")
+            status.append(NO_VALUE if value is None else value)
+            value = data.get("priority")
+            priority.append(NO_VALUE if value is None else value)
+            due.append(data.get("due"))
+            start.append(data.get("start"))
+            toggled.append(data.get("toggledAt"))
+            project.append(projects.code(project_oid or ""))
+            for assignee in data.get("assignees") or ():
+                assignee_rows.append(row)
+                assignee_oid = assignee.get("oid", "")
+                assignee_codes.append(assignees.code(assignee_oid))
+                if assignee.get("name"):
+                    names[assignee_oid] = assignee["name"]
+            for tag in data.get("tags") or ():
+                tag_rows.append(row)
+                tag_codes.append(tags.code(tag))
+        
+        return cls._build(
+            oids, status, priority, due, start, toggled, project, projects,
+            assignee_rows, assignee_codes, assignees, tag_rows, tag_codes, tags, names,
+        )
+    
+    @classmethod
+    def from_payloads(cls, payloads: Iterable[Dict[str, Any]], project_oid: Optional[str] = None) -> "TaskFrame":
+        """Build from raw task payloads (e.g. API JSON)"""
+        return cls.from_records((project_oid, data) for data in payloads)
+    
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Union[Task, CompactTask]], project_oid: Optional[str] = None) -> "TaskFrame":
+        """Build from Task or CompactTask objects (e.g. list_tasks output)"""
+        def records():
+            for task in tasks:
+                if isinstance(task, CompactTask):
+                    assignees = [{"oid": a[0], "name": a[1]} for a in task.assignee_pairs]
+                else:
+                    assignees = [{"oid": a.oid, "name": a.name} for a in task.assignees or ()]
+                yield project_oid, {
+                    "oid": task.oid,
+                    "status": task.status,
+                    "priority": task.priority,
+                    "due": task.due,
+                    "start": task.start,
+                    "toggledAt": task.toggled_at,
+                    "assignees": assignees,
+                    "tags": task.tags,
+                }
+        return cls.from_records(records())
+    
+    @classmethod
+    def from_mirror(cls, mirror, project_oid: Optional[str] = None) -> "TaskFrame":
+        """Build from a quire.sync.Mirror, optionally limited to one project"""
+        return cls.from_records(mirror.task_records(project_oid))
+    
+    @classmethod
+    def _build(
+        cls, oids, status, priority, due, start, toggled, project, projects,
+        assignee_rows, assignee_codes, assignees, tag_rows, tag_codes, tags, names,
+    ) -> "TaskFrame":
+        status = np.array(status, dtype=np.int16)
+        return cls(
+            oids=np.array(oids, dtype=object),
+            status=status,
+            priority=np.array(priority, dtype=np.int16),
+            due=_date_ordinals(due),
+            start=_date_ordinals(start),
+            completed=status == 10,  # 10 is typically "Done"
+            completed_on=_date_ordinals(toggled),
+            project=np.array(project, dtype=np.int32),
+            project_labels=projects.labels,
+            assignee_rows=np.array(assignee_rows, dtype=np.int32),
+            assignee_codes=np.array(assignee_codes, dtype=np.int32),
+            assignee_labels=assignees.labels,
+            tag_rows=np.array(tag_rows, dtype=np.int32),
+            tag_codes=np.array(tag_codes, dtype=np.int32),
+            tag_labels=tags.labels,
+            assignee_names=names,
+        )
+    
+    def __len__(self) -> int:
+        return len(self.oids)
+    
+    def __repr__(self) -> str:
+        return (
+            f"TaskFrame({len(self)} tasks, {len(self.project_labels)} projects, "
+            f"{len(self.assignee_labels)} assignees)"
+        )
+    
+    # Masks
+    
+    def overdue(self, today: Union[date, str, int, None] = None) -> np.ndarray:
+        """Open tasks whose due date is before ``today`` (default: today)"""
+        return ~self.completed & (self.due != NO_DATE) & (self.due < _to_ordinal(today))
+    
+    def due_between(self, first: Union[date, str, int], last: Union[date, str, int]) -> np.ndarray:
+        """Tasks due within [first, last], inclusive"""
+        return (self.due >= _to_ordinal(first)) & (self.due <= _to_ordinal(last))
+    
+    def assigned_to(self, assignee_oid: str) -> np.ndarray:
+        """Tasks assigned to a user"""
+        return self._has_label(self.assignee_rows, self.assignee_codes, self.assignee_labels, assignee_oid)
+    
+    def tagged(self, tag: str) -> np.ndarray:
+        """Tasks carrying a tag"""
+        return self._has_label(self.tag_rows, self.tag_codes, self.tag_labels, tag)
+    
+    def _has_label(self, rows: np.ndarray, codes: np.ndarray, labels: List[str], label: str) -> np.ndarray:
+        mask = np.zeros(len(self), dtype=bool)
+        if label in labels:
+            mask[rows[codes == labels.index(label)]] = True
+        return mask
+    
+    # Selection
+    
+    def filter(self, mask: np.ndarray) -> "TaskFrame":
+        """Rows where ``mask`` is True, as a new frame"""
+        mask = np.asarray(mask, dtype=bool)
+        # Map old row numbers to new ones so the pair arrays stay aligned
+        new_rows = np.cumsum(mask, dtype=np.int64) - 1
+        keep_assignee = mask[self.assignee_rows]
+        keep_tag = mask[self.tag_rows]
+        return TaskFrame(
+            oids=self.oids[mask],
+            status=self.status[mask],
+            priority=self.priority[mask],
+            due=self.due[mask],
+            start=self.start[mask],
+            completed=self.completed[mask],
+            completed_on=self.completed_on[mask],
+            project=self.project[mask],
+            project_labels=self.project_labels,
+            assignee_rows=new_rows[self.assignee_rows[keep_assignee]].astype(np.int32),
+            assignee_codes=self.assignee_codes[keep_assignee],
+            assignee_labels=self.assignee_labels,
+            tag_rows=new_rows[self.tag_rows[keep_tag]].astype(np.int32),
+            tag_codes=self.tag_codes[keep_tag],
+            tag_labels=self.tag_labels,
+            assignee_names=self.assignee_names,
+        )
+    
+    # Grouping
+    
+    def _groups(self, by: str) -> Tuple[Optional[np.ndarray], np.ndarray, List[Any]]:
+        """Like group_codes, but rows is None when it is simply every row in order"""
+        if by == "assignee":
+            return self.assignee_rows, self.assignee_codes, self.assignee_labels
+        if by == "tag":
+            return self.tag_rows, self.tag_codes, self.tag_labels
+        if by == "project":
+            return None, self.project, self.project_labels
+        if by == "completed":
+            return None, self.completed.view(np.int8), [False, True]
+        if by in ("status", "priority"):
+            # Small integer domains: offset by the minimum instead of sorting
+            column = getattr(self, by).astype(np.int32)
+            low = int(column.min()) if len(column) else 0
+            high = int(column.max()) if len(column) else -1
+            labels = [None if v == NO_VALUE else v for v in range(low, high + 1)]
+            return None, column - low, labels
+        raise ValueError(f"Cannot group by {by!r}; use one of {SCALAR_KEYS + MULTI_KEYS}")
+    
+    def group_codes(self, by: str) -> Tuple[np.ndarray, np.ndarray, List[Any]]:
+        """
+        Group membership for a key
+        
+        Returns:
+            (rows, codes, labels): row ``rows[i]`` belongs to group
+            ``labels[codes[i]]``. For scalar keys every row appears once;
+            for "assignee"/"tag" a row appears once per value.
+        """
+        rows, codes, labels = self._groups(by)
+        if rows is None:
+            rows = np.arange(len(self))
+        return rows, codes, labels
+    
+    def aggregate(
+        self,
+        by: str,
+        values: Optional[np.ndarray] = None,
+        how: str = "count",
+        mask: Optional[np.ndarray] = None,
+    ) -> Dict[Any, float]:
+        """
+        Aggregate a per-row array over groups
+        
+        Args:
+            by: Group key ("status", "priority", "project", "completed", "assignee", "tag")
+            values: Per-row numbers or booleans (not needed for "count")
+            how: "count", "sum" or "mean"
+            mask: Only include rows where True
+            
+        Returns:
+            {group label: aggregate} for groups with at least one row
+        """
+        rows, codes, labels = self._groups(by)
+        
+        def per_member(array: np.ndarray) -> np.ndarray:
+            return array if rows is None else array[rows]
+        
+        included = None if mask is None else per_member(np.asarray(mask, dtype=bool))
+        counts = np.bincount(codes, weights=included, minlength=len(labels))
+        
+        if how == "count":
+            result = counts
+        elif how in ("sum", "mean"):
+            if values is None:
+                raise ValueError(f"{how!r} aggregation needs values")
+            weights = per_member(np.asarray(values, dtype=np.float64))
+            if included is not None:
+                weights = weights * included
+            result = np.bincount(codes, weights=weights, minlength=len(labels))
+            if how == "mean":
+                result = np.divide(result, counts, out=np.zeros_like(result), where=counts > 0)
+        else:
+            raise ValueError(f"Unknown aggregation {how!r}")
+        
+        present = np.flatnonzero(counts)
+        if how == "count":
+            return {labels[i]: int(result[i]) for i in present}
+        return {labels[i]: result[i].item() for i in present}
+    
+    def count_by(self, by: str, mask: Optional[np.ndarray] = None) -> Dict[Any, int]:
+        """Number of tasks per group"""
+        return self.aggregate(by, how="count", mask=mask)
@@ -0,0 +1,377 @@
+"""
+Streaming, resumable CSV import into a Quire project
+
+Rows are read one at a time (quoted multi-line descriptions included),
+mapped to create_task fields and created in windows of concurrent
+requests. Every row is recorded in an append-only journal: "pending"
+before its request is sent, then "done" (with the new task OID) or
+"failed" when the API definitely rejected it. Re-running the same import
+skips finished rows and retries failed ones. Rows still pending, whether
+interrupted or failed in a way the server may have acted on (timeout,
+dropped connection, 5xx), may or may not have been created, so they are
+first matched against the tasks already in the project (same name, created
+after the pending record) and only re-created if no unclaimed task matches.
+
+Journal lines:
+  {"source": "/abs/path.csv", "project": "PROJECT_OID"}
+  {"row": 1, "state": "pending", "name": "...", "at": 1767225600.0}
+  {"row": 1, "state": "done", "oid": "TASK_OID"}
+  {"row": 2, "state": "failed", "error": "..."}
+"""
+
+import csv
+import json
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import requests
+
+from .client import QuireClient
+
+
+# Header (case-insensitive) -> create_task argument
+DEFAULT_COLUMNS = {
+    "task name": "name",
+    "name": "name",
+    "title": "name",
+    "description": "description",
+    "notes": "description",
+    "priority": "priority",
+    "tags": "tags",
+    "due date": "due",
+    "due": "due",
+    "start date": "start",
+    "start": "start",
+    "status": "status",
+    "assignee": "assignee",
+}
+
+# Same scale as `quire task --priority`
+PRIORITY_NAMES = {"high": 1, "medium": 2, "low": 3}
+
+FIELDS = ("name", "description", "priority", "tags", "due", "start", "status", "assignee")
+
+# 4xx statuses that do not prove the request was rejected before processing
+RETRYABLE_CLIENT_ERRORS = (408, 429)
+
+# Allowed lag of the local clock behind the server's when comparing a
+# pending record's time with a task's creation time
+CLOCK_SKEW = 300.0
+
+
+@dataclass
+class ImportReport:
+    """Outcome of one import run"""
+    rows: int = 0
+    created: int = 0
+    skipped: int = 0
+    reconciled: int = 0
+    failed: int = 0
+    invalid: int = 0
+    errors: Dict[int, str] = field(default_factory=dict)
+
+
+def _column_map(header: List[str], columns: Optional[Dict[str, str]]) -> Dict[int, str]:
+    mapping = {**DEFAULT_COLUMNS, **{k.lower(): v for k, v in (columns or {}).items()}}
+    by_index = {}
+    for index, title in enumerate(header):
+        target = mapping.get(title.strip().lower())
+        if target in FIELDS and target not in by_index.values():
+            by_index[index] = target
+    if "name" not in by_index.values():
+        raise ValueError(f"No task name column in CSV header: {header}")
+    return by_index
+
+
+def _int_field(column: str, value: str, names: Optional[Dict[str, int]] = None) -> int:
+    if names and value.lower() in names:
+        return names[value.lower()]
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{column}: expected a number, got {value!r}")
+
+
+def row_to_spec(row: List[str], by_index: Dict[int, str]) -> Dict[str, Any]:
+    """create_task keyword arguments for one CSV row"""
+    spec: Dict[str, Any] = {}
+    for index, target in by_index.items():
+        value = row[index].strip() if index < len(row) else ""
+        if not value:
+            continue
+        if target == "tags":
+            spec["tags"] = [tag.strip() for tag in value.split(",") if tag.strip()]
+        elif target == "priority":
+            spec["priority"] = _int_field("priority", value, PRIORITY_NAMES)
+        elif target == "status":
+            spec["status"] = _int_field("status", value)
+        else:
+            spec[target] = value
+    if not spec.get("name"):
+        raise ValueError("empty task name")
+    return spec
+
+
+def read_rows(
+    source: IO[str],
+    columns: Optional[Dict[str, str]] = None,
+) -> Iterator[Tuple[int, Union[Dict[str, Any], ValueError]]]:
+    """
+    Stream (row number, create_task spec) pairs from a CSV file
+    
+    Row numbers count data rows from 1, so they stay stable between runs.
+    A row that cannot be mapped yields its ValueError instead of a spec.
+    
+    Args:
+        source: Text stream opened with newline="" (quoted newlines are kept)
+        columns: Extra header -> field mappings (e.g. {"Summary": "name"})
+    """
+    reader = csv.reader(source)
+    header = next(reader, None)
+    if header is None:
+        return
+    by_index = _column_map(header, columns)
+    for number, row in enumerate(reader, 1):
+        if not any(cell.strip() for cell in row):
+            continue
+        try:
+            yield number, row_to_spec(row, by_index)
+        except ValueError as e:
+            yield number, e
+
+
+class _Journal:
+    """Append-only record of row outcomes; replayed to resume an import"""
+    
+    def __init__(self, path: str, source: str, project_oid: str):
+        self.path = path
+        self.done: Set[int] = set()
+        self.claimed: Set[str] = set()
+        # Rows sent without a recorded outcome: row -> (name, time sent)
+        self.pending: Dict[int, Tuple[str, Optional[float]]] = {}
+        
+        header = {"source": os.path.abspath(source), "project": project_oid}
+        if os.path.exists(path):
+            self._replay(header)
+        self._file = open(path, "a", encoding="utf-8")
+        if not os.path.getsize(path):
+            self._append(header)
+            self.flush()
+        elif not self._ends_with_newline():
+            # Close off a line torn by a crash so the next record starts clean
+            self._file.write("\n")
+    
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
+    def _replay(self, header: Dict[str, str]):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn last line from a crash mid-write
+                    continue
+                if "source" in record:
+                    if record.get("project") != header["project"]:
+                        raise ValueError(
+                            f"Journal {self.path} belongs to an import into project {record.get('project')}"
+                        )
+                    continue
+                row = record["row"]
+                if record["state"] == "pending":
+                    self.pending[row] = (record.get("name", ""), record.get("at"))
+                elif record["state"] == "done":
+                    self.done.add(row)
+                    self.claimed.add(record["oid"])
+                    self.pending.pop(row, None)
+                elif record["state"] == "failed":
+                    self.pending.pop(row, None)
+    
+    def _append(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    
+    def pending_row(self, row: int, name: str):
+        self._append({"row": row, "state": "pending", "name": name, "at": time.time()})
+    
+    def done_row(self, row: int, task_oid: str):
+        self.done.add(row)
+        self.claimed.add(task_oid)
+        self.pending.pop(row, None)
+        self._append({"row": row, "state": "done", "oid": task_oid})
+    
+    def failed_row(self, row: int, error: Exception):
+        self.pending.pop(row, None)
+        self._append({"row": row, "state": "failed", "error": str(error)})
+    
+    def flush(self):
+        """Make everything appended so far survive a crash"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+def _rejected(error: Exception) -> bool:
+    """
+    Whether a failed create certainly did not create the task
+    
+    True for a 4xx answer (other than RETRYABLE_CLIENT_ERRORS) and for local
+    errors raised before anything was sent. Timeouts, transport errors and
+    5xx answers may come after the server created the task.
+    """
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is not None and 400 <= status < 500 and status not in RETRYABLE_CLIENT_ERRORS
+    if isinstance(error, requests.RequestException):
+        return False
+    return isinstance(error, (ValueError, TypeError))
+
+
+def _created_at(value: Optional[str]) -> Optional[float]:
+    """POSIX time of an API timestamp (ISO 8601, "Z" for UTC)"""
+    if not value:
+        return None
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def _reconcile(client: QuireClient, project_oid: str, journal: _Journal) -> Set[int]:
+    """
+    Mark rows sent without an outcome as done if the project has a matching task
+    
+    A match is an unclaimed task with the row's name, created no earlier
+    than the row's pending record (less CLOCK_SKEW), so an older task that
+    happens to share the name is not taken for it. Journals written before
+    pending records carried a time match on the name alone.
+    """
+    reconciled: Set[int] = set()
+    if not journal.pending:
+        return reconciled
+    names = {name for name, _ in journal.pending.values()}
+    candidates: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+    for task in client.iter_tasks(project_oid):
+        if task.name in names and task.oid not in journal.claimed:
+            created = _created_at(task.created_at)
+            candidates[task.name].append((created if created is not None else float("-inf"), task.oid))
+    for tasks in candidates.values():
+        tasks.sort()
+    
+    for row, (name, sent_at) in sorted(journal.pending.items()):
+        tasks = candidates.get(name, [])
+        earliest = sent_at - CLOCK_SKEW if sent_at is not None else float("-inf")
+        match = next((i for i, (created, _) in enumerate(tasks) if created >= earliest), None)
+        if match is not None:
+            journal.done_row(row, tasks.pop(match)[1])
+            reconciled.add(row)
+    journal.flush()
+    return reconciled
+
+
+def default_journal_path(source: str) -> str:
+    return source + ".journal"
+
+
+def import_csv(
+    client: QuireClient,
+    source: str,
+    project_oid: str,
+    journal_path: Optional[str] = None,
+    concurrency: int = 8,
+    columns: Optional[Dict[str, str]] = None,
+    dry_run: bool = False,
+    on_progress: Optional[Callable[[ImportReport], None]] = None,
+) -> ImportReport:
+    """
+    Create one task per CSV row, resuming where an earlier run stopped
+    
+    Args:
+        client: Client used to create tasks
+        source: CSV file with a header row (see DEFAULT_COLUMNS)
+        project_oid: Project to create the tasks in
+        journal_path: Progress journal (default: SOURCE.journal)
+        concurrency: Max creates in flight
+        columns: Extra header -> field mappings
+        dry_run: Only map and validate rows; no requests, no journal
+        on_progress: Called with the running report after each window of rows
+        
+    Returns:
+        ImportReport; ``errors`` maps row numbers to failures. Failed rows
+        are retried by the next run with the same journal (after checking
+        the project for them unless the API definitely rejected them).
+    """
+    report = ImportReport()
+    window = max(1, concurrency * 4)
+    
+    with open(source, newline="", encoding="utf-8-sig") as f:
+        rows = read_rows(f, columns)
+        if dry_run:
+            for number, spec in rows:
+                report.rows += 1
+                if isinstance(spec, ValueError):
+                    report.invalid += 1
+                    report.errors[number] = str(spec)
+            return report
+        
+        journal = _Journal(journal_path or default_journal_path(source), source, project_oid)
+        try:
+            reconciled = _reconcile(client, project_oid, journal)
+            report.reconciled = len(reconciled)
+            
+            batch: List[Tuple[int, Dict[str, Any]]] = []
+            
+            def flush_batch():
+                for number, spec in batch:
+                    journal.pending_row(number, spec["name"])
+                # Pending records must be on disk before the requests go out
+                journal.flush()
+                
+                specs = [spec for _, spec in batch]
+                for (number, _), result in zip(batch, client.create_tasks(project_oid, specs, concurrency=concurrency)):
+                    if result.ok:
+                        journal.done_row(number, result.value.oid)
+                        report.created += 1
+                        continue
+                    # Anything short of a definite rejection stays pending, so
+                    # the next run looks for the task before creating it again
+                    if _rejected(result.error):
+                        journal.failed_row(number, result.error)
+                    report.failed += 1
+                    report.errors[number] = str(result.error)
+                journal.flush()
+                batch.clear()
+                if on_progress:
+                    on_progress(report)
+            
+            for number, spec in rows:
+                report.rows += 1
+                if number in journal.done:
+                    if number not in reconciled:
+                        report.skipped += 1
+                    continue
+                if isinstance(spec, ValueError):
+                    report.invalid += 1
+                    report.errors[number] = str(spec)
+                    continue
+                batch.append((number, spec))
+                if len(batch) >= window:
+                    flush_batch()
+            if batch:
+                flush_batch()
+        finally:
+            journal.close()
+    
+    return report
@@ -2,7 +2,8 @@
 Data models for Quire API responses
 """
 
-from typing import Optional, List, Dict, Any
+import sys
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -69,6 +70,8 @@ class Task:
     assignees: List[User] = None
     tags: List[str] = None
     completed: bool = False
+    toggled_at: Optional[str] = None
+    created_at: Optional[str] = None
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Task":
@@ -87,8 +90,11 @@ class Task:
             start=data.get("start"),
             due=data.get("due"),
             assignees=assignees,
-            tags=data.get("tags", []),
+            # Copied so tasks built from one shared payload do not share tags
+            tags=list(data.get("tags") or ()),
             completed=data.get("status") == 10,  # 10 is typically "Done"
+            toggled_at=data.get("toggledAt"),
+            created_at=data.get("createdAt"),
         )
     
     def __str__(self) -> str:
@@ -96,6 +102,141 @@ class Task:
         return f"{status_icon} [{self.oid}] {self.name}"
 
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share repeated short strings (dates, tags, names) between instances"""
+    return sys.intern(value) if value else value
+
+
+_UNLOADED = object()
+
+
+class CompactTask:
+    """
+    Memory-compact, slotted task for holding very large task collections
+    
+    Repeated strings are interned, assignees are kept as (id, oid, name)
+    tuples and turned into User objects only when first accessed, and the
+    description can be loaded on demand from a ``description_loader``
+    (e.g. the local mirror) instead of being held in memory.
+    """
+    
+    __slots__ = (
+        "id", "oid", "name", "status", "priority", "start", "due", "tags",
+        "completed", "toggled_at", "_description", "_description_loader", "_assignees",
+    )
+    
+    def __init__(
+        self,
+        id: str,
+        oid: str,
+        name: str,
+        description: Optional[str] = None,
+        status: Optional[int] = None,
+        priority: Optional[int] = None,
+        start: Optional[str] = None,
+        due: Optional[str] = None,
+        assignees: Tuple[Tuple[str, str, str], ...] = (),
+        tags: Tuple[str, ...] = (),
+        completed: bool = False,
+        toggled_at: Optional[str] = None,
+        description_loader: Optional[Callable[[str], Optional[str]]] = None,
+    ):
+        self.id = id
+        self.oid = oid
+        self.name = name
+        self.status = status
+        self.priority = priority
+        self.start = start
+        self.due = due
+        self.tags = tags
+        self.completed = completed
+        self.toggled_at = toggled_at
+        self._assignees = assignees
+        self._description_loader = description_loader
+        self._description = _UNLOADED if description_loader else description
+    
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        description_loader: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> "CompactTask":
+        """
+        Create CompactTask from API response
+        
+        Args:
+            data: Task payload
+            description_loader: Called with the task OID on first access to
+                ``description``; when given, the payload's description is dropped
+        """
+        return cls(
+            id=data.get("id", ""),
+            oid=data.get("oid", ""),
+            name=data.get("name", ""),
+            description=None if description_loader else data.get("description"),
+            status=data.get("status"),
+            priority=data.get("priority"),
+            start=_intern(data.get("start")),
+            due=_intern(data.get("due")),
+            assignees=tuple(
+                (_intern(a.get("id", "")), _intern(a.get("oid", "")), _intern(a.get("name", "")))
+                for a in data.get("assignees") or ()
+            ),
+            tags=tuple(_intern(t) for t in data.get("tags") or ()),
+            completed=data.get("status") == 10,  # 10 is typically "Done"
+            toggled_at=data.get("toggledAt"),
+            description_loader=description_loader,
+        )
+    
+    @property
+    def description(self) -> Optional[str]:
+        if self._description is _UNLOADED:
+            self._description = self._description_loader(self.oid)
+        return self._description
+    
+    @property
+    def assignees(self) -> List[User]:
+        if self._assignees and isinstance(self._assignees[0], tuple):
+            self._assignees = tuple(
+                User(id=id, oid=oid, name=name) for id, oid, name in self._assignees
+            )
+        return list(self._assignees)
+    
+    @property
+    def assignee_oids(self) -> Tuple[str, ...]:
+        """Assignee OIDs without hydrating User objects"""
+        return tuple(a[1] if isinstance(a, tuple) else a.oid for a in self._assignees)
+    
+    @property
+    def assignee_pairs(self) -> Tuple[Tuple[str, str], ...]:
+        """(OID, name) of each assignee without hydrating User objects"""
+        return tuple((a[1], a[2]) if isinstance(a, tuple) else (a.oid, a.name) for a in self._assignees)
+    
+    def to_task(self) -> Task:
+        """Convert to a regular Task"""
+        return Task(
+            id=self.id,
+            oid=self.oid,
+            name=self.name,
+            description=self.description,
+            status=self.status,
+            priority=self.priority,
+            start=self.start,
+            due=self.due,
+            assignees=self.assignees,
+            tags=list(self.tags),
+            completed=self.completed,
+            toggled_at=self.toggled_at,
+        )
+    
+    def __repr__(self) -> str:
+        return f"CompactTask(oid={self.oid!r}, name={self.name!r}, status={self.status!r})"
+    
+    def __str__(self) -> str:
+        status_icon = "✅" if self.completed else "⏳"
+        return f"{status_icon} [{self.oid}] {self.name}"
+
+
 @dataclass
 class Comment:
     """Quire comment model"""
@@ -0,0 +1,310 @@
+"""
+Indexed task queries over a local task store
+
+A TaskIndex holds tasks (from the mirror, or fetched from the API) with
+hash indexes on status, priority, assignee, tag and project and a sorted
+due-date index. A Query is planned before it runs. Predicates the API can
+evaluate (status, assignee OID) are pushed down when tasks are fetched.
+Locally, the most selective index lookups are intersected first, and only
+the surviving candidates are checked against the remaining filters (name
+text, completion).
+"""
+
+import bisect
+import heapq
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Tasks without a due date sort after all dated ones
+_NO_DUE = "\uffff"
+
+# Quire OIDs are long opaque tokens of letters and digits; display names
+# almost never are, and a name sent as an OID filter matches nothing
+_OID_PATTERN = re.compile(r"(?=[^\d]*\d)(?=[^a-zA-Z]*[a-zA-Z])[A-Za-z0-9._-]{16,}")
+
+
+def _looks_like_oid(value: str) -> bool:
+    """Whether ``value`` has the shape of an OID rather than a display name"""
+    return _OID_PATTERN.fullmatch(value) is not None
+
+
+def due_order(task) -> Tuple[str, str]:
+    """Sort key: due date (undated last), then name"""
+    return ((task.due or _NO_DUE)[:10], task.name)
+
+
+@dataclass
+class Query:
+    """
+    Task filters; all given conditions must hold
+    
+    ``assignee`` matches an assignee OID or, case-insensitively, a name.
+    ``tags`` requires every listed tag. ``due_from``/``due_to`` are
+    inclusive ISO dates (YYYY-MM-DD). ``text`` is a case-insensitive
+    substring of the task name.
+    """
+    projects: Optional[List[str]] = None
+    status: Optional[int] = None
+    priority: Optional[int] = None
+    assignee: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    due_from: Optional[str] = None
+    due_to: Optional[str] = None
+    text: Optional[str] = None
+    completed: Optional[bool] = None
+    limit: Optional[int] = None
+    
+    def remote_filters(self) -> Dict[str, Any]:
+        """Filters list_tasks can apply server-side"""
+        filters = {}
+        if self.status is not None:
+            filters["status"] = self.status
+        if self.assignee and _looks_like_oid(self.assignee):
+            # The API filters by OID only; names are matched locally
+            filters["assignee"] = self.assignee
+        return filters
+
+
+@dataclass
+class QueryPlan:
+    """
+    How a query was (or would be) evaluated
+    
+    ``errors`` maps the OIDs of projects whose tasks could not be fetched to
+    the exception; their tasks are missing from the result.
+    """
+    pushdown: Dict[str, Any] = field(default_factory=dict)
+    lookups: List[Tuple[str, int]] = field(default_factory=list)
+    residual: List[str] = field(default_factory=list)
+    candidates: int = 0
+    matches: int = 0
+    elapsed_ms: float = 0.0
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    
+    def __str__(self) -> str:
+        lines = []
+        if self.pushdown:
+            lines.append("pushdown: " + ", ".join(f"{k}={v}" for k, v in self.pushdown.items()))
+        for name, size in self.lookups:
+            lines.append(f"index {name}: {size} row(s)")
+        if not self.lookups:
+            lines.append("full scan")
+        if self.residual:
+            lines.append("filter: " + ", ".join(self.residual))
+        lines.append(f"{self.candidates} candidate(s) -> {self.matches} match(es) in {self.elapsed_ms:.2f} ms")
+        if self.errors:
+            lines.append(f"{len(self.errors)} project(s) could not be fetched: " + ", ".join(self.errors))
+        return "\n".join(lines)
+
+
+def _assignee_pairs(task) -> Tuple[Tuple[str, str], ...]:
+    pairs = getattr(task, "assignee_pairs", None)
+    if pairs is not None:
+        return pairs
+    return tuple((a.oid, a.name) for a in task.assignees or ())
+
+
+class TaskIndex:
+    """
+    In-memory secondary indexes over Task or CompactTask objects
+    
+    Example:
+        >>> with Mirror() as mirror:
+        ...     index = TaskIndex.from_mirror(mirror)
+        >>> index.find(Query(tags=["backend"], due_to="2025-12-31", completed=False))
+    """
+    
+    def __init__(self, records: Iterable[Tuple[str, Any]] = ()):
+        """
+        Build indexes
+        
+        Args:
+            records: (project OID, task) pairs
+        """
+        self._tasks: List[Any] = []
+        self._projects: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        self._by: Dict[str, Dict[Any, Set[int]]] = {
+            "project": defaultdict(set),
+            "status": defaultdict(set),
+            "priority": defaultdict(set),
+            "assignee": defaultdict(set),
+            "tag": defaultdict(set),
+        }
+        self._due: List[Tuple[str, int]] = []
+        self._due_sorted = True
+        for project_oid, task in records:
+            self.add(project_oid, task)
+    
+    @classmethod
+    def from_mirror(cls, mirror, project_oid: Optional[str] = None) -> "TaskIndex":
+        """Index the tasks of a quire.sync.Mirror (compact, descriptions stay on disk)"""
+        from .models import CompactTask
+        
+        return cls(
+            (project, CompactTask.from_dict(data, description_loader=mirror.task_description))
+            for project, data in mirror.task_records(project_oid)
+        )
+    
+    def __len__(self) -> int:
+        return len(self._tasks)
+    
+    def add(self, project_oid: str, task):
+        row = len(self._tasks)
+        self._tasks.append(task)
+        self._projects.append(project_oid)
+        self._row_of[task.oid] = row
+        self._by["project"][project_oid].add(row)
+        self._by["status"][task.status].add(row)
+        self._by["priority"][task.priority].add(row)
+        for oid, name in _assignee_pairs(task):
+            self._by["assignee"][oid].add(row)
+            self._by["assignee"][name.lower()].add(row)
+        for tag in task.tags or ():
+            self._by["tag"][tag.lower()].add(row)
+        if task.due:
+            self._due.append((task.due[:10], row))
+            self._due_sorted = False
+    
+    def project_of(self, task) -> Optional[str]:
+        """Project OID a task was indexed under"""
+        row = self._row_of.get(task.oid)
+        return self._projects[row] if row is not None else None
+    
+    def _due_span(self, due_from: Optional[str], due_to: Optional[str]) -> Tuple[int, int]:
+        """Slice of the sorted due index covering the range"""
+        if not self._due_sorted:
+            self._due.sort()
+            self._due_sorted = True
+        low = bisect.bisect_left(self._due, (due_from[:10],)) if due_from else 0
+        high = bisect.bisect_right(self._due, (due_to[:10], len(self._tasks))) if due_to else len(self._due)
+        return low, high
+    
+    def _lookups(self, query: Query) -> List[Tuple[str, Set[int]]]:
+        lookups = []
+        if query.projects:
+            rows = set()
+            for project_oid in query.projects:
+                rows |= self._by["project"].get(project_oid, set())
+            lookups.append(("project", rows))
+        if query.status is not None:
+            lookups.append(("status", self._by["status"].get(query.status, set())))
+        if query.priority is not None:
+            lookups.append(("priority", self._by["priority"].get(query.priority, set())))
+        if query.assignee:
+            rows = self._by["assignee"].get(query.assignee, set()) | self._by["assignee"].get(query.assignee.lower(), set())
+            lookups.append(("assignee", rows))
+        for tag in query.tags:
+            lookups.append((f"tag={tag}", self._by["tag"].get(tag.lower(), set())))
+        return lookups
+    
+    def find(self, query: Query, plan: Optional[QueryPlan] = None) -> List[Any]:
+        """
+        Tasks matching ``query``, by due date (undated last), then name
+        
+        Args:
+            query: Filters
+            plan: Filled in with how the query was evaluated (optional)
+        """
+        started = time.perf_counter()
+        plan = plan if plan is not None else QueryPlan()
+        lookups = self._lookups(query)
+        
+        # The due range is only materialized when it is the most selective
+        # lookup; otherwise the candidates' due dates are compared directly
+        due_from = query.due_from[:10] if query.due_from else None
+        due_to = query.due_to[:10] if query.due_to else None
+        check_due = False
+        if due_from or due_to:
+            low, high = self._due_span(due_from, due_to)
+            if not lookups or high - low < min(len(rows) for _, rows in lookups):
+                lookups.append(("due", {row for _, row in self._due[low:high]}))
+            else:
+                check_due = True
+        
+        # Smallest index result first, so each intersection only shrinks it
+        lookups.sort(key=lambda item: len(item[1]))
+        plan.lookups = [(name, len(rows)) for name, rows in lookups]
+        if lookups:
+            rows = set(lookups[0][1])
+            for _, other in lookups[1:]:
+                if not rows:
+                    break
+                rows &= other
+        else:
+            rows = set(range(len(self._tasks)))
+        plan.candidates = len(rows)
+        
+        text = query.text.lower() if query.text else None
+        plan.residual = [
+            name for name, on in (("due", check_due), ("text", text), ("completed", query.completed is not None)) if on
+        ]
+        
+        matches = []
+        for row in rows:
+            task = self._tasks[row]
+            if check_due:
+                due = task.due[:10] if task.due else None
+                if not due or (due_from and due < due_from) or (due_to and due > due_to):
+                    continue
+            if text and text not in task.name.lower():
+                continue
+            if query.completed is not None and task.completed != query.completed:
+                continue
+            matches.append(task)
+        
+        matches.sort(key=due_order)
+        if query.limit is not None:
+            matches = matches[:query.limit]
+        
+        plan.matches = len(matches)
+        plan.elapsed_ms = (time.perf_counter() - started) * 1000
+        return matches
+
+
+def assigned_to_me(
+    client,
+    include_completed: bool = False,
+    project_oids: Optional[List[str]] = None,
+    concurrency: Optional[int] = None,
+    errors: Optional[Dict[str, Exception]] = None,
+) -> List[Tuple[Any, Any]]:
+    """
+    Tasks assigned to the current user across projects, by due date
+    
+    Works with any client offering get_current_user, list_projects,
+    iter_tasks and gather (QuireClient, or the CLI's cache-only reader).
+    Projects whose tasks cannot be fetched are left out and recorded in
+    ``errors`` (project OID -> exception) when given.
+    See QuireClient.list_my_tasks.
+    """
+    user, projects = client.gather(client.get_current_user, client.list_projects)
+    user, projects = user.result(), projects.result()
+    if project_oids is not None:
+        wanted = set(project_oids)
+        projects = [p for p in projects if p.oid in wanted]
+    else:
+        projects = [p for p in projects if not p.archived]
+    
+    def fetch(project):
+        # Assignee is pushed down; the local checks also cover an API that ignores it
+        run = [
+            (project, task)
+            for task in client.iter_tasks(project.oid, assignee=user.oid)
+            if (include_completed or not task.completed)
+            and any(a.oid == user.oid for a in task.assignees or ())
+        ]
+        run.sort(key=lambda pair: due_order(pair[1]))
+        return run
+    
+    results = client.gather(*[lambda p=p: fetch(p) for p in projects], concurrency=concurrency)
+    runs = []
+    for project, result in zip(projects, results):
+        if result.ok:
+            runs.append(result.value)
+        elif errors is not None:
+            errors[project.oid] = result.error
+    return list(heapq.merge(*runs, key=lambda pair: due_order(pair[1])))
@@ -0,0 +1,160 @@
+"""
+Client-side rate limiting and retry policy for Quire API requests
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+
+@dataclass
+class ThrottleStats:
+    """Counters describing how much a client has been throttled"""
+    requests: int = 0
+    throttled: int = 0
+    retries: int = 0
+    paced_seconds: float = 0.0
+    backoff_seconds: float = 0.0
+    
+    @property
+    def throttled_seconds(self) -> float:
+        """Total time spent waiting, by pacing or after throttled/failed calls"""
+        return self.paced_seconds + self.backoff_seconds
+
+
+class RateLimiter:
+    """
+    Token-bucket request pacer with Retry-After aware retries
+    
+    One limiter can be shared by several clients (and threads) that draw on
+    the same API budget. A Retry-After from any call pauses all of them.
+    """
+    
+    # Statuses worth retrying; a 429 means the call was rejected outright so
+    # it is safe to resend even for POST, the rest only for idempotent methods
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        """
+        Initialize rate limiter
+        
+        Args:
+            rate: Sustained requests per second (None disables pacing)
+            burst: Requests allowed back to back before pacing (default: max(1, rate))
+            max_retries: Retries per call for throttled or transient failures
+            backoff: Base delay in seconds for exponential backoff
+            max_backoff: Upper bound for a single backoff delay; a longer
+                Retry-After is not shortened, the call fails instead
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        
+        self.rate = rate
+        self.burst = burst or max(1, int(rate or 1))
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats = ThrottleStats()
+        
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+    
+    def acquire(self):
+        """Block until the next request may be sent"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                delay = self._paused_until - now
+                if delay <= 0 and self.rate is None:
+                    self.stats.requests += 1
+                    self.stats.paced_seconds += waited
+                    return
+                if delay <= 0:
+                    elapsed = now - self._updated_at
+                    self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                    self._updated_at = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self.stats.requests += 1
+                        self.stats.paced_seconds += waited
+                        return
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+    
+    def retry_delay(self, method: str, response: requests.Response, attempt: int) -> Optional[float]:
+        """
+        Decide whether a response should be retried
+        
+        Args:
+            method: HTTP method of the request
+            response: Response received
+            attempt: Zero-based attempt number that produced the response
+            
+        Returns:
+            Seconds to wait before retrying (never less than the server's
+            Retry-After), or None to give up
+        """
+        status = response.status_code
+        if status not in self.RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        if status != 429 and method.upper() not in self.IDEMPOTENT_METHODS:
+            return None
+        
+        retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            # Retrying before the server's deadline only earns another 429,
+            # so a wait longer than we allow ends the retries instead
+            return retry_after if retry_after <= self.max_backoff else None
+        
+        # Full jitter keeps parallel workers from retrying in lockstep
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+    
+    def wait_before_retry(self, delay: float, throttled: bool):
+        """
+        Sleep before a retry
+        
+        A throttled response pauses every caller sharing this limiter, since
+        the budget is exhausted for all of them.
+        """
+        with self._lock:
+            self.stats.retries += 1
+            self.stats.backoff_seconds += delay
+            if throttled:
+                self.stats.throttled += 1
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        time.sleep(delay)
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given as seconds or an HTTP date"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,107 @@
+"""
+Incremental decoding of JSON array responses
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+# Characters a JSON number can continue with after raw_decode stopped
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_decoder = json.JSONDecoder()
+
+
+def _continues_number(value: Any, buf: str, end: int) -> bool:
+    """Whether everything after a decoded number is the start of its remainder"""
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return False
+    return all(char in _NUMBER_CHARS for char in buf[end:])
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array as its bytes arrive
+    
+    Only the undecoded tail of the stream is buffered, so memory stays
+    proportional to the largest single element rather than the whole body.
+    
+    Args:
+        chunks: Raw body chunks (e.g. ``response.iter_content(...)``)
+        encoding: Text encoding of the body
+        
+    Raises:
+        ValueError: If the body is not a well-formed JSON array
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buf = ""
+    pos = 0
+    exhausted = False
+    
+    def more() -> bool:
+        nonlocal buf, pos, exhausted
+        if exhausted:
+            return False
+        for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                buf = buf[pos:] + text
+                pos = 0
+                return True
+        buf = buf[pos:] + decoder.decode(b"", final=True)
+        pos = 0
+        exhausted = True
+        return False
+    
+    def skip_whitespace() -> bool:
+        """Advance past whitespace; False if the stream ended"""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return True
+            if not more():
+                return False
+    
+    if not skip_whitespace() or buf[pos] != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    
+    expect_value = True
+    first = True
+    while True:
+        if not skip_whitespace():
+            raise ValueError("Unterminated JSON array")
+        
+        char = buf[pos]
+        if char == "]" and (first or not expect_value):
+            return
+        if not expect_value:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' at offset {pos}")
+            pos += 1
+            expect_value = True
+            continue
+        
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if more():
+                    continue
+                raise ValueError("Truncated or invalid JSON array element")
+            # A number (or literal) touching the end of the buffer may continue
+            # in the next chunk, so make sure more data is not pending. That
+            # includes a number cut after "." or "e" ("1." + "5"), where the
+            # decoder stops before the incomplete tail
+            if not exhausted and (end == len(buf) or _continues_number(value, buf, end)):
+                more()
+                continue
+            break
+        
+        pos = end
+        expect_value = False
+        first = False
+        yield value
@@ -0,0 +1,542 @@
+"""
+Local SQLite mirror of a Quire workspace with incremental sync
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .client import QuireClient
+from .models import Comment, CompactTask, Project, Task
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    oid TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    oid TEXT PRIMARY KEY,
+    project_oid TEXT NOT NULL,
+    data TEXT NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_project ON tasks (project_oid);
+CREATE TABLE IF NOT EXISTS comments (
+    oid TEXT PRIMARY KEY,
+    task_oid TEXT NOT NULL,
+    data TEXT NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS comments_task ON comments (task_oid);
+CREATE TABLE IF NOT EXISTS cursors (
+    project_oid TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+# Full-text index over task names/descriptions and comments. search_docs maps
+# each FTS row to its entity so rows can be replaced by OID without a scan.
+SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_docs (
+    rowid INTEGER PRIMARY KEY,
+    oid TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    task_oid TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_docs_task ON search_docs (task_oid);
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(
+    name, body, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# Matches in a task name count this much more than in descriptions/comments
+NAME_WEIGHT = 10.0
+
+# Ranked index rows considered per requested search result
+CANDIDATES_PER_HIT = 20
+
+
+def _digest(data: Any) -> str:
+    """Stable content hash of an API payload"""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+
+@dataclass
+class SyncReport:
+    """
+    Counts of changes applied by one sync run
+    
+    ``errors`` is keyed by project OID for task lists that could not be
+    fetched and by task OID for comment lists that could not be refreshed.
+    """
+    projects: int = 0
+    projects_skipped: int = 0
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    
+    @property
+    def changes(self) -> int:
+        return self.created + self.updated + self.deleted
+
+
+@dataclass
+class SearchHit:
+    """One task matching a full-text search (by its name, description or a comment)"""
+    task_oid: str
+    project_oid: str
+    name: str
+    snippet: str
+    score: float
+    matched: str
+
+
+def _match_expression(text: str) -> str:
+    """FTS5 query requiring every word of ``text``, each also as a prefix"""
+    words = re.findall(r"\w+", text)
+    # The exact term is listed too, so whole-word matches rank above prefix-only ones
+    return " AND ".join(f'("{word}" OR "{word}"*)' for word in words)
+
+
+class Mirror:
+    """
+    SQLite copy of projects, tasks and comments
+    
+    Entities are stored as raw API payloads alongside a content digest, so
+    a sync only writes (and reports) rows whose content actually changed.
+    Each applied change can be appended to an NDJSON change feed.
+    """
+    
+    DEFAULT_CONCURRENCY = 8
+    DEFAULT_PATH = "quire_mirror.db"
+    
+    def __init__(self, path: Optional[str] = None, feed: Optional[IO[str]] = None):
+        """
+        Open (or create) a mirror database
+        
+        Args:
+            path: SQLite database file (reads QUIRE_MIRROR_DB, default: quire_mirror.db;
+                ":memory:" for a throwaway mirror)
+            feed: Text stream that receives one JSON line per change (optional)
+        """
+        self.path = path or os.getenv("QUIRE_MIRROR_DB", self.DEFAULT_PATH)
+        self.feed = feed
+        self._lock = threading.RLock()
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        self.searchable = self._init_search()
+    
+    def _init_search(self) -> bool:
+        """Create the full-text index; False if this SQLite lacks FTS5"""
+        try:
+            self.db.executescript(SEARCH_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+        # A mirror created before the index existed is indexed once, here
+        if not self.db.execute("SELECT 1 FROM search_docs LIMIT 1").fetchone() and \
+                self.db.execute("SELECT 1 FROM tasks LIMIT 1").fetchone():
+            self.rebuild_search_index()
+        return True
+    
+    def close(self):
+        self.db.close()
+    
+    def __enter__(self) -> "Mirror":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    # Change feed
+    
+    def _emit(self, op: str, kind: str, oid: str, data: Optional[Dict] = None, **extra):
+        if self.feed is None:
+            return
+        event = {
+            "op": op,
+            "type": kind,
+            "oid": oid,
+            "at": datetime.now(timezone.utc).isoformat(),
+            **extra,
+        }
+        if data is not None:
+            event["data"] = data
+        self.feed.write(json.dumps(event, ensure_ascii=False) + "\n")
+    
+    # Full-text index
+    
+    def _index(self, kind: str, oid: str, task_oid: str, name: str, body: Optional[str]):
+        row = self.db.execute("SELECT rowid FROM search_docs WHERE oid = ?", (oid,)).fetchone()
+        if row:
+            rowid = row[0]
+            self.db.execute("DELETE FROM search WHERE rowid = ?", (rowid,))
+        else:
+            rowid = self.db.execute(
+                "INSERT INTO search_docs (oid, kind, task_oid) VALUES (?, ?, ?)", (oid, kind, task_oid)
+            ).lastrowid
+        self.db.execute("INSERT INTO search (rowid, name, body) VALUES (?, ?, ?)", (rowid, name, body or ""))
+    
+    def _unindex(self, column: str, value: str):
+        """Drop index rows by "oid" (one entity) or "task_oid" (a task and its comments)"""
+        rowids = [r[0] for r in self.db.execute(f"SELECT rowid FROM search_docs WHERE {column} = ?", (value,))]
+        for rowid in rowids:
+            self.db.execute("DELETE FROM search WHERE rowid = ?", (rowid,))
+        self.db.execute(f"DELETE FROM search_docs WHERE {column} = ?", (value,))
+    
+    def rebuild_search_index(self):
+        """Re-index every mirrored task and comment"""
+        with self._lock, self.db:
+            self.db.execute("DELETE FROM search")
+            self.db.execute("DELETE FROM search_docs")
+            for oid, data in self.db.execute("SELECT oid, data FROM tasks").fetchall():
+                data = json.loads(data)
+                self._index("task", oid, oid, data.get("name", ""), data.get("description"))
+            for oid, task_oid, data in self.db.execute("SELECT oid, task_oid, data FROM comments").fetchall():
+                self._index("comment", oid, task_oid, "", json.loads(data).get("description"))
+    
+    # Writes
+    
+    def _upsert(self, table: str, parent_column: Optional[str], parent: Optional[str], data: Dict) -> Optional[str]:
+        """Insert or update one row; returns "created"/"updated", or None if unchanged"""
+        oid = data["oid"]
+        digest = _digest(data)
+        row = self.db.execute(f"SELECT digest FROM {table} WHERE oid = ?", (oid,)).fetchone()
+        if row and row[0] == digest:
+            return None
+        
+        payload = json.dumps(data, ensure_ascii=False)
+        if parent_column:
+            self.db.execute(
+                f"INSERT OR REPLACE INTO {table} (oid, {parent_column}, data, digest) VALUES (?, ?, ?, ?)",
+                (oid, parent, payload, digest),
+            )
+        else:
+            self.db.execute(
+                f"INSERT OR REPLACE INTO {table} (oid, data, digest) VALUES (?, ?, ?)",
+                (oid, payload, digest),
+            )
+        return "updated" if row else "created"
+    
+    def _put_task(self, project_oid: str, data: Dict) -> Optional[str]:
+        op = self._upsert("tasks", "project_oid", project_oid, data)
+        if op:
+            if self.searchable:
+                self._index("task", data["oid"], data["oid"], data.get("name", ""), data.get("description"))
+            self._emit(op, "task", data["oid"], data, project=project_oid)
+        return op
+    
+    def _remove_task(self, task_oid: str) -> bool:
+        row = self.db.execute("SELECT project_oid FROM tasks WHERE oid = ?", (task_oid,)).fetchone()
+        if not row:
+            return False
+        self.db.execute("DELETE FROM comments WHERE task_oid = ?", (task_oid,))
+        self.db.execute("DELETE FROM tasks WHERE oid = ?", (task_oid,))
+        if self.searchable:
+            self._unindex("task_oid", task_oid)
+        self._emit("deleted", "task", task_oid, project=row[0])
+        return True
+    
+    def upsert_project(self, data: Dict) -> Optional[str]:
+        """Store a project payload; returns the change applied, if any"""
+        with self._lock, self.db:
+            op = self._upsert("projects", None, None, data)
+            if op:
+                self._emit(op, "project", data["oid"], data)
+            return op
+    
+    def upsert_task(self, project_oid: str, data: Dict) -> Optional[str]:
+        """Store a task payload; returns the change applied, if any"""
+        with self._lock, self.db:
+            return self._put_task(project_oid, data)
+    
+    def merge_task(self, data: Dict, project_oid: Optional[str] = None) -> Optional[str]:
+        """
+        Apply a possibly partial task payload on top of the mirrored one
+        
+        Fields missing from ``data`` keep their mirrored values. The project
+        defaults to the one the task is already mirrored under.
+        
+        Raises:
+            LookupError: If the task is not mirrored and no project is given
+        """
+        with self._lock, self.db:
+            row = self.db.execute(
+                "SELECT project_oid, data FROM tasks WHERE oid = ?", (data["oid"],)
+            ).fetchone()
+            if row:
+                project_oid = project_oid or row[0]
+                data = {**json.loads(row[1]), **data}
+            elif not project_oid:
+                raise LookupError(f"Task {data['oid']} is not mirrored and the event names no project")
+            return self._put_task(project_oid, data)
+    
+    def delete_task(self, task_oid: str) -> bool:
+        """Remove a task and its comments; returns True if it was mirrored"""
+        with self._lock, self.db:
+            return self._remove_task(task_oid)
+    
+    def replace_comments(self, task_oid: str, payload: List[Dict]) -> int:
+        """Make a task's mirrored comments match ``payload``; returns changes"""
+        changes = 0
+        with self._lock, self.db:
+            existing = {
+                r[0] for r in self.db.execute("SELECT oid FROM comments WHERE task_oid = ?", (task_oid,))
+            }
+            for data in payload:
+                existing.discard(data["oid"])
+                op = self._upsert("comments", "task_oid", task_oid, data)
+                if op:
+                    if self.searchable:
+                        self._index("comment", data["oid"], task_oid, "", data.get("description"))
+                    self._emit(op, "comment", data["oid"], data, task=task_oid)
+                    changes += 1
+            for comment_oid in existing:
+                self.db.execute("DELETE FROM comments WHERE oid = ?", (comment_oid,))
+                if self.searchable:
+                    self._unindex("oid", comment_oid)
+                self._emit("deleted", "comment", comment_oid, task=task_oid)
+                changes += 1
+        return changes
+    
+    def delete_project(self, project_oid: str) -> int:
+        """Remove a project and everything in it; returns tasks removed"""
+        with self._lock, self.db:
+            task_oids = [
+                r[0] for r in self.db.execute("SELECT oid FROM tasks WHERE project_oid = ?", (project_oid,))
+            ]
+            for task_oid in task_oids:
+                self._remove_task(task_oid)
+            self.db.execute("DELETE FROM cursors WHERE project_oid = ?", (project_oid,))
+            if self.db.execute("DELETE FROM projects WHERE oid = ?", (project_oid,)).rowcount:
+                self._emit("deleted", "project", project_oid)
+            return len(task_oids)
+    
+    # Reads
+    
+    def projects(self) -> List[Project]:
+        rows = self.db.execute("SELECT data FROM projects ORDER BY oid")
+        return [Project.from_dict(json.loads(data)) for (data,) in rows]
+    
+    def task_records(self, project_oid: Optional[str] = None) -> Iterator[Tuple[str, Dict]]:
+        """(project OID, raw task payload) pairs, optionally limited to one project"""
+        if project_oid:
+            rows = self.db.execute(
+                "SELECT project_oid, data FROM tasks WHERE project_oid = ? ORDER BY oid", (project_oid,)
+            )
+        else:
+            rows = self.db.execute("SELECT project_oid, data FROM tasks ORDER BY oid")
+        for project, data in rows:
+            yield project, json.loads(data)
+    
+    def task_payloads(self, project_oid: Optional[str] = None) -> Iterator[Dict]:
+        """Raw task payloads, optionally limited to one project"""
+        for _, data in self.task_records(project_oid):
+            yield data
+    
+    def tasks(self, project_oid: Optional[str] = None, compact: bool = False) -> Iterator[Union[Task, CompactTask]]:
+        """
+        Mirrored tasks, optionally limited to one project
+        
+        With ``compact``, yields CompactTask objects whose descriptions stay
+        in the database until accessed.
+        """
+        for data in self.task_payloads(project_oid):
+            if compact:
+                yield CompactTask.from_dict(data, description_loader=self.task_description)
+            else:
+                yield Task.from_dict(data)
+    
+    def task_description(self, task_oid: str) -> Optional[str]:
+        row = self.db.execute(
+            "SELECT json_extract(data, '$.description') FROM tasks WHERE oid = ?", (task_oid,)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def get_task(self, task_oid: str) -> Optional[Task]:
+        row = self.db.execute("SELECT data FROM tasks WHERE oid = ?", (task_oid,)).fetchone()
+        return Task.from_dict(json.loads(row[0])) if row else None
+    
+    def search(
+        self,
+        text: str,
+        limit: int = 20,
+        project_oid: Optional[str] = None,
+        raw: bool = False,
+    ) -> List[SearchHit]:
+        """
+        Tasks matching ``text`` in their name, description or comments, best first
+        
+        Ranking is BM25 with name matches weighted NAME_WEIGHT times higher;
+        a task matched by several rows (e.g. two comments) appears once, with
+        its best match.
+        
+        Args:
+            text: Words that must all occur (each also matches as a prefix)
+            limit: Max tasks returned
+            project_oid: Only search this project
+            raw: Pass ``text`` to FTS5 unchanged (AND/OR/NOT, "phrases", NEAR)
+            
+        Raises:
+            RuntimeError: If this SQLite build has no FTS5
+        """
+        if not self.searchable:
+            raise RuntimeError("Full-text search needs SQLite with FTS5")
+        expression = text if raw else _match_expression(text)
+        if not expression:
+            return []
+        
+        # The project filter must apply before the candidate LIMIT, or other
+        # projects' best hits could crowd out every row of this one
+        in_project = """
+                JOIN search_docs pd ON pd.rowid = search.rowid
+                JOIN tasks pt ON pt.oid = pd.task_oid AND pt.project_oid = ?
+        """ if project_oid else ""
+        sql = f"""
+            WITH hits AS (
+                SELECT search.rowid AS rowid, bm25(search, {NAME_WEIGHT}, 1.0) AS score,
+                       snippet(search, -1, '[', ']', '…', 12) AS snippet
+                FROM search
+                {in_project}
+                WHERE search MATCH ?
+                ORDER BY score
+                LIMIT ?
+            )
+            SELECT d.task_oid, t.project_oid, json_extract(t.data, '$.name'),
+                   hits.snippet, min(hits.score) AS best, d.kind
+            FROM hits
+            JOIN search_docs d ON d.rowid = hits.rowid
+            JOIN tasks t ON t.oid = d.task_oid
+            GROUP BY d.task_oid
+            ORDER BY best
+            LIMIT ?
+        """
+        # Only the best-ranked rows are grouped into tasks: enough for `limit`
+        # tasks unless many of them match through dozens of comments each
+        params = ([project_oid] if project_oid else []) + [expression, limit * CANDIDATES_PER_HIT, limit]
+        # For min(), SQLite takes the other bare columns from the best-scoring row
+        return [SearchHit(*row) for row in self.db.execute(sql, params)]
+    
+    def comments(self, task_oid: str) -> List[Comment]:
+        rows = self.db.execute("SELECT data FROM comments WHERE task_oid = ? ORDER BY oid", (task_oid,))
+        return [Comment.from_dict(json.loads(data)) for (data,) in rows]
+    
+    # Sync
+    
+    def _apply_project_tasks(self, project_oid: str, payload: List[Dict], report: SyncReport) -> List[str]:
+        """Diff a project's task list against the mirror; returns changed task OIDs"""
+        changed = []
+        with self._lock, self.db:
+            existing = {
+                r[0] for r in self.db.execute("SELECT oid FROM tasks WHERE project_oid = ?", (project_oid,))
+            }
+            for data in payload:
+                existing.discard(data["oid"])
+                op = self._put_task(project_oid, data)
+                if op == "created":
+                    report.created += 1
+                elif op == "updated":
+                    report.updated += 1
+                if op:
+                    changed.append(data["oid"])
+            
+            for task_oid in existing:
+                self._remove_task(task_oid)
+                report.deleted += 1
+            
+            self.db.execute(
+                "INSERT OR REPLACE INTO cursors (project_oid, digest, synced_at) VALUES (?, ?, ?)",
+                (project_oid, _digest(payload), time.time()),
+            )
+        return changed
+    
+    def _sync_comments(self, client: QuireClient, task_oids: List[str], concurrency: int, report: SyncReport):
+        """Refresh comments of the given tasks, recording failed fetches in the report"""
+        calls = [
+            lambda oid=oid: client._request("GET", f"/task/id/{oid}/comment/list")
+            for oid in task_oids
+        ]
+        for task_oid, result in zip(task_oids, client._run_batch(calls, concurrency=concurrency)):
+            if result.ok:
+                self.replace_comments(task_oid, result.value)
+            else:
+                report.errors[task_oid] = result.error
+    
+    def sync(
+        self,
+        client: QuireClient,
+        project_oids: Optional[List[str]] = None,
+        comments: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> SyncReport:
+        """
+        Bring the mirror up to date with Quire
+        
+        Projects whose task list is unchanged since the last sync (same
+        cursor digest) are skipped without touching the database. Give the
+        client a ResponseCache to also turn those fetches into cheap 304s.
+        
+        Args:
+            client: Client used to fetch data
+            project_oids: Limit the sync to these projects (default: all)
+            comments: Also refresh comments of created/updated tasks
+            concurrency: Max project fetches in flight
+            
+        Returns:
+            SyncReport with counts of applied changes and per-project errors
+        """
+        report = SyncReport()
+        
+        project_payloads = client._request("GET", "/project/list")
+        if project_oids is None:
+            listed = {p["oid"] for p in project_payloads}
+            for (oid,) in self.db.execute("SELECT oid FROM projects").fetchall():
+                if oid not in listed:
+                    report.deleted += self.delete_project(oid)
+        else:
+            wanted = set(project_oids)
+            project_payloads = [p for p in project_payloads if p["oid"] in wanted]
+        
+        for data in project_payloads:
+            self.upsert_project(data)
+        
+        cursors = dict(self.db.execute("SELECT project_oid, digest FROM cursors").fetchall())
+        oids = [p["oid"] for p in project_payloads]
+        
+        # Fetch in windows so only a bounded number of task lists are held at once
+        window = max(1, concurrency * 2)
+        for start in range(0, len(oids), window):
+            chunk = oids[start:start + window]
+            calls = [
+                lambda oid=oid: client._request("GET", f"/project/id/{oid}/task/list")
+                for oid in chunk
+            ]
+            results = client._run_batch(calls, concurrency=concurrency)
+            
+            for project_oid, result in zip(chunk, results):
+                report.projects += 1
+                if not result.ok:
+                    report.errors[project_oid] = result.error
+                    continue
+                if cursors.get(project_oid) == _digest(result.value):
+                    report.projects_skipped += 1
+                    continue
+                
+                changed = self._apply_project_tasks(project_oid, result.value, report)
+                if comments and changed:
+                    self._sync_comments(client, changed, concurrency, report)
+        
+        if self.feed is not None:
+            self.feed.flush()
+        return report
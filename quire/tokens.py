@@ -0,0 +1,134 @@
+"""
+Access/refresh token store shared by every process on a host
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class TokenStore:
+    """
+    Owner-only JSON file of OAuth tokens, keyed by account scope
+
+    Entries are keyed by ``quire.cache.account_scope(client ID, configured
+    refresh token)``, the scope the response cache uses, so two accounts of
+    one OAuth client never pick up each other's tokens, and a refresh token
+    re-authorized in .env starts a new entry instead of being replaced by a
+    stale stored one.
+
+    ``lock()`` takes an exclusive ``flock`` on a sibling lock file, so when
+    several processes find the access token expired only the first one
+    refreshes it; the others wait and then read the new token. Rotated
+    refresh tokens are written back under the original scope.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize token store
+
+        Args:
+            path: Token file (reads QUIRE_TOKEN_CACHE, default: ~/.config/quire/tokens.json)
+        """
+        if path is None:
+            path = os.getenv("QUIRE_TOKEN_CACHE") or os.path.join(
+                os.getenv("XDG_CONFIG_HOME") or os.path.expanduser("~/.config"), "quire", "tokens.json"
+            )
+
+        self.path = Path(os.path.expanduser(path))
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+        self._thread_lock = threading.RLock()
+        self._lock_file = None
+        self._depth = 0
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the store exclusively across processes (re-entrant within one)"""
+        with self._thread_lock:
+            if self._depth == 0:
+                fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+                self._lock_file = os.fdopen(fd, "r+")
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    # Closing the descriptor releases the flock
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def _read_all(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def load(self, account: str) -> Optional[Dict]:
+        """
+        Tokens stored for an account
+
+        Args:
+            account: Account scope the tokens were saved under
+
+        Returns:
+            Dict with access_token, refresh_token and expires_at (epoch seconds),
+            or None if nothing is stored
+        """
+        entry = self._read_all().get(account)
+        return entry if isinstance(entry, dict) else None
+
+    def save(
+        self,
+        account: str,
+        access_token: str,
+        expires_at: float,
+        refresh_token: Optional[str] = None,
+    ):
+        """Store the tokens of an account, replacing the file atomically"""
+        with self.lock():
+            data = self._read_all()
+            data[account] = {
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "expires_at": expires_at,
+                "saved_at": time.time(),
+            }
+            self._write(data)
+
+    def clear(self, account: Optional[str] = None):
+        """Forget one account's tokens, or all of them"""
+        with self.lock():
+            if account is None:
+                self.path.unlink(missing_ok=True)
+                return
+            data = self._read_all()
+            if data.pop(account, None) is not None:
+                self._write(data)
+
+    def _write(self, data: Dict[str, Dict]):
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        # Created owner-only: the file holds long-lived credentials
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
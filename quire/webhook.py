@@ -0,0 +1,421 @@
+"""
+Webhook receiver that keeps a local Mirror current without polling
+
+Quire POSTs a JSON notification for every change it is subscribed to. The
+receiver acknowledges each one as soon as it is queued and applies it to a
+Mirror in the background. Events are sharded by task OID, and every shard
+applies its events one at a time, so changes to one task land in the order
+they arrived while different tasks are applied concurrently.
+
+Endpoints:
+  POST <path>     Quire notification (default path: /webhook) -> 202
+  GET  /metrics   Throughput, queue depth and lag as JSON
+  GET  /healthz   Liveness probe
+  
+The HTTP handling is a minimal asyncio implementation (one request per
+read, keep-alive, Content-Length bodies only), which is all Quire and a
+reverse proxy in front of it need.
+"""
+
+import asyncio
+import hmac
+import json
+import os
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from .models import Task
+from .sync import Mirror
+
+
+# Event types that remove the task from the mirror (compared exactly, case
+# insensitive); any other event, e.g. "tag_removed", updates the task
+DELETE_EVENTS = frozenset({
+    "delete", "deleted", "remove", "removed",
+    "task.delete", "task.deleted", "task.remove", "task.removed",
+    "task_delete", "task_deleted", "task_remove", "task_removed",
+    "delete_task", "remove_task",
+})
+
+_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+
+def _parse_time(value: Any) -> Optional[float]:
+    """Epoch seconds of an ISO-8601 timestamp, or None"""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+@dataclass
+class WebhookEvent:
+    """One task change received from Quire"""
+    kind: str
+    task_oid: str
+    project_oid: Optional[str]
+    payload: Dict[str, Any]
+    received_at: float
+    occurred_at: Optional[float] = None
+    name: str = ""
+    
+    @property
+    def deleted(self) -> bool:
+        return self.kind == "delete"
+    
+    @property
+    def task(self) -> Task:
+        """The payload as a Task (fields absent from a partial payload are empty)"""
+        return Task.from_dict(self.payload)
+
+
+def parse_event(body: Dict[str, Any], received_at: Optional[float] = None) -> Optional[WebhookEvent]:
+    """
+    Turn a Quire notification into a WebhookEvent
+    
+    Accepts the notification envelope (``{"type", "token", "data": {...}}``)
+    as well as a bare ``data`` object. The task payload may be partial.
+    
+    Returns:
+        The event, or None if the notification does not concern a task
+    """
+    data = body.get("data") if isinstance(body.get("data"), dict) else body
+    task = data.get("task")
+    if not isinstance(task, dict) or not task.get("oid"):
+        return None
+    
+    project = data.get("project") or task.get("project")
+    project_oid = project.get("oid") if isinstance(project, dict) else project
+    
+    name = str(data.get("type") or body.get("type") or data.get("action") or "")
+    deleted = bool(task.get("deleted")) or name.lower() in DELETE_EVENTS
+    
+    return WebhookEvent(
+        kind="delete" if deleted else "upsert",
+        task_oid=task["oid"],
+        project_oid=project_oid or None,
+        payload={k: v for k, v in task.items() if k not in ("project", "deleted")},
+        received_at=received_at if received_at is not None else time.time(),
+        occurred_at=_parse_time(data.get("when") or body.get("when")),
+        name=name,
+    )
+
+
+def _summary(samples: Deque[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"avg": None, "p95": None, "max": None}
+    ordered = sorted(samples)
+    return {
+        "avg": round(sum(ordered) / len(ordered), 4),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+@dataclass
+class WebhookMetrics:
+    """
+    Counters and recent latencies of a WebhookServer
+    
+    ``apply_lag`` is the time from receipt to the change being in the
+    mirror; ``event_lag`` is from the change happening in Quire (the
+    notification's ``when``) to the same point. Both cover the most recent
+    ``window`` events.
+    """
+    window: int = 1000
+    received: int = 0
+    applied: int = 0
+    unchanged: int = 0
+    ignored: int = 0
+    rejected: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.time)
+    last_error: Optional[str] = None
+    
+    def __post_init__(self):
+        self._applied_at: Deque[float] = deque(maxlen=self.window)
+        self._apply_lag: Deque[float] = deque(maxlen=self.window)
+        self._event_lag: Deque[float] = deque(maxlen=self.window)
+    
+    def record(self, event: WebhookEvent, changed: bool):
+        now = time.time()
+        if changed:
+            self.applied += 1
+        else:
+            self.unchanged += 1
+        self._applied_at.append(now)
+        self._apply_lag.append(now - event.received_at)
+        if event.occurred_at is not None:
+            self._event_lag.append(max(0.0, now - event.occurred_at))
+    
+    def events_per_second(self, period: float = 60.0) -> float:
+        """Events applied per second over the last ``period`` seconds"""
+        now = time.time()
+        recent = sum(1 for t in self._applied_at if now - t <= period)
+        return recent / max(1e-9, min(period, now - self.started_at))
+    
+    def snapshot(self, queued: int = 0) -> Dict[str, Any]:
+        return {
+            "uptime": round(time.time() - self.started_at, 1),
+            "received": self.received,
+            "applied": self.applied,
+            "unchanged": self.unchanged,
+            "ignored": self.ignored,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "queued": queued,
+            "events_per_second": round(self.events_per_second(), 2),
+            "apply_lag": _summary(self._apply_lag),
+            "event_lag": _summary(self._event_lag),
+            "last_error": self.last_error,
+        }
+
+
+class WebhookServer:
+    """
+    Receive Quire notifications over HTTP and apply them to a Mirror
+    
+    Example:
+        >>> with Mirror("quire_mirror.db") as mirror:
+        ...     asyncio.run(WebhookServer(mirror, port=8787).run())
+    """
+    
+    DEFAULT_PORT = 8787
+    MAX_BODY = 1024 * 1024
+    
+    def __init__(
+        self,
+        mirror: Mirror,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        path: str = "/webhook",
+        secret: Optional[str] = None,
+        shards: int = 8,
+        queue_size: int = 1000,
+        on_event: Optional[Callable[[WebhookEvent, Optional[str]], None]] = None,
+    ):
+        """
+        Initialize receiver
+        
+        Args:
+            mirror: Mirror the events are applied to
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one, see ``port`` after start())
+            path: Path Quire posts notifications to
+            secret: Token expected in notifications (reads QUIRE_WEBHOOK_SECRET;
+                compared with the ``token`` field, the ``token`` query
+                parameter or an X-Quire-Token header)
+            shards: Independent ordered queues; events of one task always use the same one
+            queue_size: Events each shard may hold before new ones get 503 (Quire
+                retries); a batch with more events than this for one shard gets 413
+            on_event: Called with each applied event and the mirror change
+                ("created"/"updated"/"deleted", or None if nothing changed)
+        """
+        self.mirror = mirror
+        self.host = host
+        self.port = port
+        self.path = path
+        self.secret = secret if secret is not None else os.getenv("QUIRE_WEBHOOK_SECRET")
+        self.shards = max(1, shards)
+        self.queue_size = queue_size
+        self.on_event = on_event
+        self.metrics = WebhookMetrics()
+        
+        self._queues: List[asyncio.Queue] = []
+        self._workers: List[asyncio.Task] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+    
+    # Lifecycle
+    
+    async def start(self):
+        """Start listening and applying events"""
+        self._queues = [asyncio.Queue(self.queue_size) for _ in range(self.shards)]
+        self._workers = [asyncio.create_task(self._apply_shard(q)) for q in self._queues]
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def serve_forever(self):
+        await self._server.serve_forever()
+    
+    async def drain(self):
+        """Wait until every queued event has been applied"""
+        await asyncio.gather(*(q.join() for q in self._queues))
+    
+    async def close(self):
+        """Stop accepting notifications, apply what is queued, then stop"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.drain()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+    
+    async def run(self):
+        """start(), then serve until cancelled (Ctrl+C), then close()"""
+        await self.start()
+        try:
+            await self.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self.close()
+    
+    @property
+    def queued(self) -> int:
+        return sum(q.qsize() for q in self._queues)
+    
+    # Applying events
+    
+    def _queue_for(self, task_oid: str) -> asyncio.Queue:
+        return self._queues[zlib.crc32(task_oid.encode()) % self.shards]
+    
+    def _apply(self, event: WebhookEvent) -> Optional[str]:
+        if event.deleted:
+            op = "deleted" if self.mirror.delete_task(event.task_oid) else None
+        else:
+            op = self.mirror.merge_task(event.payload, event.project_oid)
+        if op and self.mirror.feed is not None:
+            self.mirror.feed.flush()
+        return op
+    
+    async def _apply_shard(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            event = await queue.get()
+            try:
+                # SQLite writes block, so they run off the event loop
+                op = await loop.run_in_executor(None, self._apply, event)
+            except Exception as e:
+                self.metrics.failed += 1
+                self.metrics.last_error = f"{event.task_oid}: {e}"
+            else:
+                self.metrics.record(event, changed=op is not None)
+                if self.on_event is not None:
+                    self.on_event(event, op)
+            finally:
+                queue.task_done()
+    
+    def _receive(self, body: bytes, headers: Dict[str, str], query: Dict[str, List[str]]) -> Tuple[int, Dict]:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, {"error": "invalid JSON"}
+        notifications = payload if isinstance(payload, list) else [payload]
+        if not all(isinstance(n, dict) for n in notifications):
+            return 400, {"error": "expected a JSON object"}
+        
+        if self.secret:
+            offered = headers.get("x-quire-token") or (query.get("token") or [None])[0]
+            for notification in notifications:
+                token = offered or notification.get("token") or ""
+                if not hmac.compare_digest(str(token), self.secret):
+                    self.metrics.rejected += len(notifications)
+                    return 401, {"error": "invalid token"}
+        
+        received_at = time.time()
+        events = []
+        ignored = 0
+        for notification in notifications:
+            event = parse_event(notification, received_at)
+            if event is None:
+                ignored += 1
+            else:
+                events.append(event)
+        
+        # A batch is queued whole or not at all, so every shard must have room
+        # for all of its events before any of them is enqueued
+        queues = [self._queue_for(event.task_oid) for event in events]
+        wanted: Dict[asyncio.Queue, int] = {}
+        for queue in queues:
+            wanted[queue] = wanted.get(queue, 0) + 1
+        for queue, count in wanted.items():
+            if queue.maxsize > 0 and count > queue.maxsize:
+                # Would never fit, so a retry cannot succeed
+                return 413, {"error": f"batch has {count} events for one queue; at most {queue.maxsize} fit"}
+        for queue, count in wanted.items():
+            if queue.maxsize > 0 and count > queue.maxsize - queue.qsize():
+                return 503, {"error": "backlog full, retry later"}
+        for queue, event in zip(queues, events):
+            queue.put_nowait(event)
+        self.metrics.ignored += ignored
+        self.metrics.received += len(events)
+        return 202, {"queued": len(events)}
+    
+    # HTTP
+    
+    def _route(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict]:
+        path, _, query = target.partition("?")
+        if path == "/metrics" and method == "GET":
+            return 200, self.metrics.snapshot(self.queued)
+        if path == "/healthz" and method == "GET":
+            return 200, {"status": "ok"}
+        if path == self.path:
+            if method != "POST":
+                return 405, {"error": "use POST"}
+            return self._receive(body, headers, parse_qs(query))
+        return 404, {"error": "not found"}
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    break
+                
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                
+                length = int(headers.get("content-length") or 0)
+                if length > self.MAX_BODY:
+                    self._respond(writer, 413, {"error": "payload too large"}, close=True)
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b""
+                
+                close = headers.get("connection", "").lower() == "close"
+                status, reply = self._route(method.upper(), target, headers, body)
+                self._respond(writer, status, reply, close)
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+    
+    @staticmethod
+    def _respond(writer: asyncio.StreamWriter, status: int, reply: Dict, close: bool = False):
+        body = json.dumps(reply).encode()
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
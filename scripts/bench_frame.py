@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark KPI-style aggregations: Python loops over Task vs TaskFrame
+
+Usage:
+  python scripts/bench_frame.py
+  python scripts/bench_frame.py --tasks 1000000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from collections import Counter
+from datetime import date
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quire.models import Task
+from quire.frame import TaskFrame
+
+
+def payloads(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    users = [{"oid": f"user-{i:04d}", "name": f"Employee {i}"} for i in range(500)]
+    dates = [f"2026-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)]
+    for i in range(count):
+        yield {
+            "oid": f"task-{i:08d}",
+            "name": f"Task {i}",
+            "status": rng.choice([0, 0, 5, 10]),
+            "priority": rng.randint(-1, 2),
+            "due": rng.choice(dates),
+            "assignees": rng.sample(users, rng.randint(1, 2)),
+            "tags": rng.sample(["frontend", "backend", "kpi", "docs"], rng.randint(0, 2)),
+        }
+
+
+def timed(label: str, fn, repeat: int = 3):
+    best = min(_elapsed(fn) for _ in range(repeat))
+    print(f"  {label:<34} {best * 1000:10.1f} ms")
+    return best
+
+
+def _elapsed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TaskFrame aggregations")
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="Number of tasks (default: 1M)")
+    args = parser.parse_args()
+    
+    data = list(payloads(args.tasks))
+    tasks = [Task.from_dict(d) for d in data]
+    
+    start = time.perf_counter()
+    frame = TaskFrame.from_payloads(data)
+    print(f"Built {frame} in {time.perf_counter() - start:.2f} s\n")
+    
+    today = date(2026, 7, 1)
+    today_iso = today.isoformat()
+    
+    print("Python loops over List[Task]:")
+    loops = [
+        timed("completed count", lambda: sum(1 for t in tasks if t.completed)),
+        timed("overdue count", lambda: sum(1 for t in tasks if not t.completed and t.due and t.due < today_iso)),
+        timed("tasks per priority", lambda: Counter(t.priority for t in tasks)),
+        timed("completed per assignee", lambda: Counter(a.oid for t in tasks if t.completed for a in t.assignees)),
+    ]
+    
+    print("\nTaskFrame:")
+    vectorized = [
+        timed("completed count", lambda: int(frame.completed.sum())),
+        timed("overdue count", lambda: int(frame.overdue(today).sum())),
+        timed("tasks per priority", lambda: frame.count_by("priority")),
+        timed("completed per assignee", lambda: frame.count_by("assignee", mask=frame.completed)),
+    ]
+    
+    print(f"\nTotal speedup: {sum(loops) / sum(vectorized):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory held by task collections: Task vs CompactTask
+
+Builds N synthetic task payloads (decoded from JSON, like API responses),
+converts them with each model and reports the memory retained by the
+resulting list, measured with tracemalloc.
+
+Usage:
+  python scripts/bench_models.py
+  python scripts/bench_models.py --sizes 10000 100000 1000000   # 1M takes several minutes
+"""
+
+import os
+import sys
+import gc
+import json
+import random
+import argparse
+import tracemalloc
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quire.models import CompactTask, Task
+
+
+USERS = [{"id": f"u{i}", "oid": f"user-oid-{i:04d}", "name": f"Employee {i}"} for i in range(200)]
+TAGS = ["frontend", "backend", "testing", "security", "kpi", "i18n", "docs", "performance"]
+DATES = [f"2026-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)]
+BATCH = 10_000
+
+
+def payload_batches(count: int, seed: int = 42):
+    """Yield lists of task payloads decoded from JSON, BATCH at a time"""
+    rng = random.Random(seed)
+    for start in range(0, count, BATCH):
+        batch = [
+            {
+                "id": f"t{i}",
+                "oid": f"task-oid-{i:08d}",
+                "name": f"Task {i}: implement feature {rng.randint(1, 500)}",
+                "description": "Details about the work to be done. " * rng.randint(1, 6),
+                "status": rng.choice([0, 0, 5, 10]),
+                "priority": rng.randint(0, 3),
+                "start": rng.choice(DATES),
+                "due": rng.choice(DATES),
+                "assignees": rng.sample(USERS, rng.randint(1, 2)),
+                "tags": rng.sample(TAGS, rng.randint(0, 3)),
+            }
+            for i in range(start, min(start + BATCH, count))
+        ]
+        # Round-trip through JSON so strings are fresh objects, as in a response
+        yield json.loads(json.dumps(batch))
+
+
+def retained_bytes(count: int, convert) -> int:
+    """Memory still allocated by the converted list once payloads are gone"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = []
+    for batch in payload_batches(count):
+        items.extend(convert(data) for data in batch)
+        del batch
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return after - before
+
+
+def lazy_description(oid: str):
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark task model memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000],
+                        help="Collection sizes (default: 10k 100k)")
+    args = parser.parse_args()
+    
+    models = [
+        ("Task", Task.from_dict),
+        ("CompactTask", CompactTask.from_dict),
+        ("CompactTask (lazy desc)", lambda data: CompactTask.from_dict(data, description_loader=lazy_description)),
+    ]
+    
+    print(f"{'tasks':>10}  {'model':<24} {'retained':>12} {'per task':>10} {'vs Task':>8}")
+    for size in args.sizes:
+        baseline = None
+        for label, convert in models:
+            used = retained_bytes(size, convert)
+            baseline = baseline or used
+            print(f"{size:>10,}  {label:<24} {used / 2**20:>9.1f} MB {used / size:>8.0f} B {used / baseline:>7.0%}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI startup: import time, cached commands and time to first request
+
+Each case runs in a fresh interpreter, several times; the median is shown.
+
+  - interpreter:      python -c pass (floor for everything below)
+  - import quire:     package import with lazy attributes
+  - import client:    quire.client, i.e. requests + the HTTP client
+  - quire --help
+  - cached tasks:     `quire tasks` served from a warm response cache
+  - first request:    `quire tasks --no-cache` until a local stand-in API
+                      receives the request (token pre-seeded in a token store)
+                      
+No credentials or network access are needed: everything uses a temporary
+cache/token directory and a localhost server.
+
+Usage:
+  python scripts/bench_startup.py
+  python scripts/bench_startup.py --runs 20
+  python -X importtime -m quire tasks 2> import.log   # per-module breakdown
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import statistics
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from quire.cache import ResponseCache, account_scope
+from quire.tokens import TokenStore
+
+
+PROJECT = {"id": "bench", "oid": "bench-project", "name": "Benchmark project"}
+TASKS = [
+    {"id": str(i), "oid": f"bench-task-{i}", "name": f"Task {i}", "status": 10 if i % 3 == 0 else 0, "priority": i % 4}
+    for i in range(50)
+]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Records when the first request of a run arrives"""
+    
+    protocol_version = "HTTP/1.1"
+    first_request_at = None
+    
+    def do_GET(self):
+        if StandInHandler.first_request_at is None:
+            StandInHandler.first_request_at = time.perf_counter()
+        body = json.dumps(TASKS if self.path.endswith("/task/list") else PROJECT).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def run(cmd, env) -> float:
+    """Wall time of one subprocess run, in ms"""
+    start = time.perf_counter()
+    subprocess.run(cmd, env=env, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def first_request(cmd, env) -> float:
+    """Time from process start to the first request reaching the server, in ms"""
+    StandInHandler.first_request_at = None
+    start = time.perf_counter()
+    subprocess.run(cmd, env=env, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+    return (StandInHandler.first_request_at - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark quire CLI startup")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per case (default: 10)")
+    args = parser.parse_args()
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_base = f"http://127.0.0.1:{server.server_port}/api"
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "PYTHONPATH": ROOT,
+            "QUIRE_API_BASE": api_base,
+            "QUIRE_CACHE_DIR": os.path.join(tmp, "cache"),
+            "QUIRE_TOKEN_CACHE": os.path.join(tmp, "tokens.json"),
+            "QUIRE_CLIENT_ID": "bench",
+            "QUIRE_CLIENT_SECRET": "bench",
+            "QUIRE_DEFAULT_PROJECT": PROJECT["oid"],
+        }
+        
+        # Warm cache (fresh for the default TTL), and a valid token so no OAuth call is made
+        cache = ResponseCache(env["QUIRE_CACHE_DIR"])
+        scope = account_scope(env["QUIRE_CLIENT_ID"], env.get("QUIRE_REFRESH_TOKEN"))
+        cache.set(cache.key(f"{api_base}/project/id/{PROJECT['oid']}", scope=scope), PROJECT)
+        cache.set(cache.key(f"{api_base}/project/id/{PROJECT['oid']}/task/list", scope=scope), TASKS)
+        TokenStore(env["QUIRE_TOKEN_CACHE"]).save(scope, "bench-token", time.time() + 3600)
+        
+        python = sys.executable
+        cases = [
+            ("interpreter", run, [python, "-c", "pass"]),
+            ("import quire", run, [python, "-c", "import quire"]),
+            ("import quire.client", run, [python, "-c", "import quire.client"]),
+            ("quire --help", run, [python, "-m", "quire", "--help"]),
+            ("cached tasks", run, [python, "-m", "quire", "tasks"]),
+            ("first request", first_request, [python, "-m", "quire", "tasks", "--no-cache"]),
+        ]
+        
+        print(f"{'case':<22} {'median':>9} {'min':>9}")
+        for label, measure, cmd in cases:
+            times = [measure(cmd, env) for _ in range(args.runs)]
+            print(f"{label:<22} {statistics.median(times):>6.1f} ms {min(times):>6.1f} ms")
+    
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-call latency of the Quire client transport
+
+Starts a local HTTP/1.1 stand-in for the Quire API and times the same
+GET call made two ways:
+
+  - one-shot: module-level requests.request() (new connection per call)
+  - pooled:   QuireClient with its keep-alive session
+  
+Usage:
+  python scripts/bench_transport.py
+  python scripts/bench_transport.py --calls 2000 --delay-ms 2
+  
+Note: localhost has no TLS handshake and near-zero RTT, so the measured
+gap understates what pooling saves against https://quire.io.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import statistics
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quire import QuireClient, QuireAuth
+
+
+PAYLOAD = json.dumps({"id": "bench", "oid": "bench-oid", "name": "Benchmark project"}).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive JSON endpoint"""
+    
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.0
+    
+    def do_GET(self):
+        if self.delay:
+            time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(delay: float) -> ThreadingHTTPServer:
+    """Start the stand-in server on a free localhost port"""
+    StandInHandler.delay = delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_auth() -> QuireAuth:
+    """Auth stub with a pre-issued token so no OAuth call is made"""
+    auth = QuireAuth(client_id="bench", client_secret="bench")
+    auth.access_token = "bench-token"
+    auth.token_expires_at = datetime.max
+    return auth
+
+
+def time_calls(fn, calls: int) -> list:
+    """Return per-call latencies in milliseconds"""
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: list):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<10} mean {statistics.mean(samples):7.3f} ms   "
+          f"p50 {statistics.median(samples):7.3f} ms   p95 {p95:7.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Quire client transport")
+    parser.add_argument("--calls", type=int, default=500, help="Calls per mode (default: 500)")
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="Simulated server time per call")
+    args = parser.parse_args()
+    
+    server = start_server(args.delay_ms / 1000)
+    api_base = f"http://127.0.0.1:{server.server_address[1]}/api"
+    auth = bench_auth()
+    
+    def one_shot():
+        response = requests.request(
+            "GET",
+            f"{api_base}/project/id/bench-oid",
+            headers={**auth.get_auth_headers(), "Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    print(f"⏱️  {args.calls} calls per mode against {api_base}\n")
+    
+    with QuireClient(auth=auth, api_base=api_base) as client:
+        # Warm up both paths so the first connect isn't counted for pooled mode
+        one_shot()
+        client.get_project("bench-oid")
+        
+        before = time_calls(one_shot, args.calls)
+        after = time_calls(lambda: client.get_project("bench-oid"), args.calls)
+    
+    server.shutdown()
+    
+    report("one-shot", before)
+    report("pooled", after)
+    print(f"\n  Speedup: {statistics.mean(before) / statistics.mean(after):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,20 +7,52 @@ It extracts the task OID from the branch name and updates the task status.
 
 Expected branch naming: feature/TASK_OID-description
 Example: feature/abc123xyz-implement-login
+
+Batch mode (--range and/or --pr-body) also scans commit messages and the PR
+description for task references and updates every referenced task at once,
+within a time budget. References look like:
+
+  quire:abc123xyz   task:abc123xyz   task/abc123xyz   Quire-Task: abc123xyz
+  
+Usage:
+  python scripts/ci_update_task.py feature/abc123xyz-login
+  python scripts/ci_update_task.py --range origin/main..HEAD --pr-body "$PR_BODY"
+  python scripts/ci_update_task.py --range "$BEFORE..$AFTER" --budget 5
 """
 
 import os
 import sys
 import re
+import time
+import argparse
+import subprocess
+from typing import Iterable, List, Optional
 from dotenv import load_dotenv
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from quire import QuireClient
+from quire import QuireClient, RateLimiter
+
+
+BRANCH_PATTERNS = [
+    re.compile(r'feature/([a-zA-Z0-9]+)-'),  # feature/abc123-description
+    re.compile(r'task/([a-zA-Z0-9]+)'),       # task/abc123
+    re.compile(r'([a-zA-Z0-9]+)-'),           # abc123-description
+]
+
+# One pass over any amount of text finds every explicit task reference. An
+# OID mixes letters and digits, so prose like "Task: refactor" is not one
+TASK_REFERENCE = re.compile(
+    r'(?:\bquire(?:-task)?\s*[:#]|\btask\s*[:/#])\s*'
+    r'((?=[a-zA-Z0-9]*[0-9])(?=[a-zA-Z0-9]*[a-zA-Z])[a-zA-Z0-9]{6,})\b',
+    re.IGNORECASE,
+)
 
+DONE_STATUS = 10
 
-def extract_task_oid_from_branch(branch_name: str) -> str:
+
+def extract_task_oid_from_branch(branch_name: str) -> Optional[str]:
     """
     Extract task OID from branch name
     
@@ -29,83 +61,201 @@ def extract_task_oid_from_branch(branch_name: str) -> str:
     - task/TASK_OID
     - TASK_OID-anything
     """
-    patterns = [
-        r'feature/([a-zA-Z0-9]+)-',  # feature/abc123-description
-        r'task/([a-zA-Z0-9]+)',       # task/abc123
-        r'([a-zA-Z0-9]+)-',           # abc123-description
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, branch_name)
+    for pattern in BRANCH_PATTERNS:
+        match = pattern.search(branch_name)
         if match:
             return match.group(1)
     
     return None
 
 
+def extract_task_oids(texts: Iterable[str]) -> List[str]:
+    """Task OIDs referenced in the given texts, deduplicated in first-seen order"""
+    oids = {}
+    for text in texts:
+        for match in TASK_REFERENCE.finditer(text):
+            oids.setdefault(match.group(1), None)
+    return list(oids)
+
+
+def commit_messages(revision_range: str) -> str:
+    """All commit messages of a git revision range, as one string"""
+    result = subprocess.run(
+        ["git", "log", "--format=%B", revision_range],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def completion_comment(pr_number: Optional[str], build_url: Optional[str]) -> str:
+    comment_parts = ["✅ Completed via CI/CD pipeline"]
+    if pr_number:
+        comment_parts.append(f"PR/MR: #{pr_number}")
+    if build_url:
+        comment_parts.append(f"Build: {build_url}")
+    return "\n".join(comment_parts)
+
+
+class BudgetLimiter(RateLimiter):
+    """Retry policy that never sends or waits past a deadline"""
+    
+    def __init__(self, deadline: float):
+        super().__init__(rate=float(os.getenv("QUIRE_RATE_LIMIT", 0)) or None)
+        self.deadline = deadline
+    
+    def acquire(self):
+        if time.monotonic() >= self.deadline:
+            raise TimeoutError("Time budget used up")
+        super().acquire()
+    
+    def retry_delay(self, method, response, attempt):
+        delay = super().retry_delay(method, response, attempt)
+        if delay is None or time.monotonic() + delay >= self.deadline:
+            return None
+        return delay
+
+
+def update_single(task_oid: str, comment: str):
+    """Update one task, showing its state before and after"""
+    client = QuireClient()
+    
+    # Get current task
+    task = client.get_task(task_oid)
+    print(f"Current task: {task.name}")
+    print(f"Current status: {task.status}\n")
+    
+    # Update to "Done" (status code 10)
+    print(f"Updating task to 'Done' (status: {DONE_STATUS})...")
+    updated_task = client.update_task(task_oid, status=DONE_STATUS)
+    
+    # Add comment with CI/CD info
+    print(f"Adding comment: {comment}\n")
+    client.add_comment(task_oid, comment)
+    
+    print("=" * 80)
+    print("🎉 Task updated successfully!\n")
+    print(f"Task: {updated_task.name}")
+    print(f"Status: {updated_task.status}")
+    print("=" * 80)
+
+
+def update_batch(task_oids: List[str], comment: str, budget: float, concurrency: int) -> int:
+    """
+    Update and comment on every task concurrently within ``budget`` seconds
+    
+    Returns:
+        Number of tasks not fully updated
+    """
+    # No retry or request starts past the budget; one still running when it
+    # ends is abandoned (main() exits without waiting for it)
+    client = QuireClient(
+        pool_size=concurrency,
+        timeout=budget,
+        rate_limiter=BudgetLimiter(time.monotonic() + budget),
+    )
+    
+    calls = []
+    for task_oid in task_oids:
+        calls.append(lambda oid=task_oid: client.update_task(oid, status=DONE_STATUS))
+        calls.append(lambda oid=task_oid: client.add_comment(oid, comment))
+    
+    started = time.perf_counter()
+    results = client.gather(*calls, concurrency=concurrency, timeout=budget)
+    elapsed = time.perf_counter() - started
+    
+    failed = 0
+    for i, task_oid in enumerate(task_oids):
+        update, commented = results[2 * i], results[2 * i + 1]
+        if update.ok and commented.ok:
+            print(f"  ✅ {task_oid}  {update.value.name}")
+            continue
+        failed += 1
+        errors = [f"{label}: {r.error}" for label, r in (("update", update), ("comment", commented)) if not r.ok]
+        icon = "⏱️ " if any(isinstance(r.error, TimeoutError) for r in (update, commented)) else "❌"
+        print(f"  {icon} {task_oid}  {'; '.join(errors)}")
+    
+    print(f"\n{len(task_oids) - failed}/{len(task_oids)} task(s) updated in {elapsed:.1f}s")
+    return failed
+
+
 def main():
     load_dotenv()
     
+    parser = argparse.ArgumentParser(description="Mark Quire tasks done from CI")
+    parser.add_argument("branch", nargs="?", help="Branch name (default: BRANCH_NAME or CI_COMMIT_BRANCH)")
+    parser.add_argument("--range", dest="revision_range", help="Also scan commit messages of this git range (e.g. main..HEAD)")
+    parser.add_argument("--pr-body", help="Also scan this PR/MR description (default: PR_BODY)")
+    parser.add_argument("--budget", type=float, default=8.0, help="Batch mode time budget in seconds (default: 8)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Batch mode parallel requests (default: 16)")
+    parser.add_argument("--strict", action="store_true", help="Fail the job if any update fails")
+    
+    args = parser.parse_args()
+    
     # Get environment variables from CI/CD
-    branch_name = os.getenv("BRANCH_NAME") or os.getenv("CI_COMMIT_BRANCH") or sys.argv[1] if len(sys.argv) > 1 else None
+    branch_name = args.branch or os.getenv("BRANCH_NAME") or os.getenv("CI_COMMIT_BRANCH")
+    pr_body = args.pr_body if args.pr_body is not None else os.getenv("PR_BODY")
     pr_number = os.getenv("PR_NUMBER") or os.getenv("CI_MERGE_REQUEST_IID")
     build_url = os.getenv("BUILD_URL") or os.getenv("CI_PIPELINE_URL")
+    batch = bool(args.revision_range or pr_body)
     
-    if not branch_name:
+    if not branch_name and not batch:
         print("❌ Error: No branch name provided")
         print("Set BRANCH_NAME environment variable or pass as argument")
         sys.exit(1)
     
     print("🤖 CI/CD Quire Task Updater\n")
     print("=" * 80)
-    print(f"Branch: {branch_name}")
+    if branch_name:
+        print(f"Branch: {branch_name}")
+    if args.revision_range:
+        print(f"Commits: {args.revision_range}")
     if pr_number:
         print(f"PR/MR: #{pr_number}")
     print()
     
-    # Extract task OID
-    task_oid = extract_task_oid_from_branch(branch_name)
-    
-    if not task_oid:
-        print("⚠️  No task OID found in branch name")
-        print("Expected format: feature/TASK_OID-description")
-        print("Example: feature/abc123xyz-implement-login")
-        print("\nSkipping Quire update.")
-        sys.exit(0)  # Exit successfully, just skip update
-    
-    print(f"📌 Found task OID: {task_oid}\n")
+    # Extract task OID(s)
+    branch_oid = extract_task_oid_from_branch(branch_name) if branch_name else None
+    comment = completion_comment(pr_number, build_url)
     
     try:
-        client = QuireClient()
-        
-        # Get current task
-        task = client.get_task(task_oid)
-        print(f"Current task: {task.name}")
-        print(f"Current status: {task.status}\n")
+        if not batch:
+            if not branch_oid:
+                print("⚠️  No task OID found in branch name")
+                print("Expected format: feature/TASK_OID-description")
+                print("Example: feature/abc123xyz-implement-login")
+                print("\nSkipping Quire update.")
+                sys.exit(0)  # Exit successfully, just skip update
+            
+            print(f"📌 Found task OID: {branch_oid}\n")
+            update_single(branch_oid, comment)
+            return
         
-        # Update to "Done" (status code 10)
-        print("Updating task to 'Done' (status: 10)...")
-        updated_task = client.update_task(task_oid, status=10)
+        texts = [pr_body or ""]
+        if args.revision_range:
+            texts.append(commit_messages(args.revision_range))
+        task_oids = extract_task_oids(texts)
+        if branch_oid and branch_oid not in task_oids:
+            task_oids.insert(0, branch_oid)
         
-        # Add comment with CI/CD info
-        comment_parts = ["✅ Completed via CI/CD pipeline"]
-        if pr_number:
-            comment_parts.append(f"PR/MR: #{pr_number}")
-        if build_url:
-            comment_parts.append(f"Build: {build_url}")
+        if not task_oids:
+            print("⚠️  No task references found. Skipping Quire update.")
+            sys.exit(0)
         
-        comment = "\n".join(comment_parts)
-        print(f"Adding comment: {comment}\n")
-        client.add_comment(task_oid, comment)
+        print(f"📌 Found {len(task_oids)} task(s), budget {args.budget:g}s\n")
+        failed = update_batch(task_oids, comment, args.budget, args.concurrency)
         
-        print("=" * 80)
-        print("🎉 Task updated successfully!\n")
-        print(f"Task: {updated_task.name}")
-        print(f"Status: {updated_task.status}")
-        print("=" * 80)
+        # Worker threads abandoned at the deadline would otherwise be joined
+        # at interpreter exit, holding the job open past the budget
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1 if failed and args.strict else 0)
         
     except Exception as e:
         print(f"❌ Error updating Quire task: {e}")
+        if args.strict:
+            sys.exit(1)
         print("\nThis is non-critical - continuing CI/CD pipeline")
         sys.exit(0)  # Don't fail the build if Quire update fails
 
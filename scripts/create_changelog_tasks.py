@@ -8,6 +8,7 @@ for a 2-week sprint.
 
 import sys
 import os
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
 # Add parent directory to path
@@ -16,6 +17,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from quire import QuireClient
 
 
+# Parallel create calls kept in flight
+CONCURRENCY = 8
+
+
 # Task list from changelogs with time estimates (2 weeks = 80 hours total)
 TASKS = [
     # From CHANGELOG_DEC01.md - Manager Dashboard & Team Management
@@ -258,50 +263,59 @@ def main():
     print(f"\n🚀 Creating tasks...\n")
     
     try:
-        client = QuireClient()
-        created_tasks = []
+        client = QuireClient(pool_size=CONCURRENCY)
         
-        for i, task_data in enumerate(TASKS, 1):
-            # Calculate due date (distribute over 2 weeks)
-            # High priority: Week 1, Medium: Week 1-2, Low: Week 2
-            from datetime import datetime, timedelta
-            today = datetime.now()
-            
-            if task_data['priority'] == 1:
-                due_date = (today + timedelta(days=7)).strftime('%Y-%m-%d')
-            elif task_data['priority'] == 2:
-                due_date = (today + timedelta(days=10)).strftime('%Y-%m-%d')
-            else:
-                due_date = (today + timedelta(days=14)).strftime('%Y-%m-%d')
-            
+        # Due dates distributed over 2 weeks
+        # High priority: Week 1, Medium: Week 1-2, Low (or anything else): Week 2
+        today = datetime.now()
+        due_dates = {
+            1: (today + timedelta(days=7)).strftime('%Y-%m-%d'),
+            2: (today + timedelta(days=10)).strftime('%Y-%m-%d'),
+            3: (today + timedelta(days=14)).strftime('%Y-%m-%d'),
+        }
+        
+        specs = []
+        for task_data in TASKS:
             # Add time estimate to description
             description = f"{task_data['description']}\n\n⏱️ Estimated: {task_data['hours']} hours"
             if task_data.get('tags'):
                 description += f"\n🏷️ Tags: {', '.join(task_data['tags'])}"
             
-            print(f"[{i}/{len(TASKS)}] Creating: {task_data['name'][:50]}...")
-            
-            task = client.create_task(
-                project_oid=project_oid,
-                name=task_data['name'],
-                description=description,
-                priority=task_data['priority'],
-                due=due_date,
-                tags=task_data.get('tags', [])
-            )
-            
-            created_tasks.append({
-                'name': task.name,
-                'oid': task.oid,
-                'hours': task_data['hours'],
-                'priority': task_data['priority']
+            specs.append({
+                'name': task_data['name'],
+                'description': description,
+                'priority': task_data['priority'],
+                'due': due_dates.get(task_data['priority'], due_dates[3]),
+                'tags': task_data.get('tags', []),
             })
-            
-            print(f"   ✅ Created: {task.oid}")
+        
+        completed = 0
+        
+        def report(result):
+            nonlocal completed
+            completed += 1
+            name = TASKS[result.index]['name'][:50]
+            if result.ok:
+                print(f"[{completed}/{len(TASKS)}] ✅ {name}... → {result.value.oid}")
+            else:
+                print(f"[{completed}/{len(TASKS)}] ❌ {name}... → {result.error}")
+        
+        results = client.create_tasks(project_oid, specs, concurrency=CONCURRENCY, on_result=report)
+        
+        created_tasks = [
+            {
+                'name': result.value.name,
+                'oid': result.value.oid,
+                'hours': TASKS[result.index]['hours'],
+                'priority': TASKS[result.index]['priority'],
+            }
+            for result in results if result.ok
+        ]
+        failed = [result for result in results if not result.ok]
         
         # Summary
         print("\n" + "=" * 80)
-        print("  🎉 All Tasks Created!")
+        print("  ⚠️  Some Tasks Failed" if failed else "  🎉 All Tasks Created!")
         print("=" * 80)
         
         print(f"\n📋 Summary:")
@@ -324,8 +338,16 @@ def main():
         if len(created_tasks) > 5:
             print(f"\n   ... and {len(created_tasks) - 5} more")
         
+        if failed:
+            print(f"\n⚠️  {len(failed)} task(s) failed:")
+            for result in failed:
+                print(f"   ❌ {TASKS[result.index]['name'][:60]}: {result.error}")
+        
         print("\n" + "=" * 80 + "\n")
         
+        if failed:
+            sys.exit(1)
+            
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from quire import QuireClient
+from quire import QuireClient, ResponseCache
 
 
 def main():
@@ -34,26 +34,29 @@ def main():
     print("=" * 80)
     
     try:
-        client = QuireClient()
+        # Shares the listing cache so the write invalidates it
+        client = QuireClient(cache=ResponseCache())
         
-        # Get project info
-        project = client.get_project(args.project_oid)
-        print(f"Project: {project.name}\n")
-        
-        # Create task
-        print(f"Creating task: {args.name}")
-        
-        task = client.create_task(
-            project_oid=args.project_oid,
-            name=args.name,
-            description=args.description,
-            status=args.status,
-            priority=args.priority,
-            assignee=args.assignee,
-            start=args.start,
-            due=args.due,
-            tags=args.tags,
+        # Fetch the project name while the task is being created
+        project, task = client.gather(
+            lambda: client.get_project(args.project_oid),
+            lambda: client.create_task(
+                project_oid=args.project_oid,
+                name=args.name,
+                description=args.description,
+                status=args.status,
+                priority=args.priority,
+                assignee=args.assignee,
+                start=args.start,
+                due=args.due,
+                tags=args.tags,
+            ),
         )
+        # A failed lookup must not hide that the task was created
+        if project.ok:
+            print(f"Project: {project.value.name}\n")
+        print(f"Creating task: {args.name}")
+        task = task.result()
         
         print("\n✅ Task created successfully!\n")
         print(f"OID: {task.oid}")
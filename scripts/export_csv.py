@@ -3,6 +3,8 @@
 Export changelog tasks to CSV for Quire import
 Since OAuth app creation requires specific account permissions,
 this creates a CSV file you can import directly into Quire.
+
+To export the tasks already in Quire, use `python -m quire export FILE`.
 """
 import csv
 from datetime import datetime, timedelta
@@ -127,6 +129,9 @@ def main():
     print()
     print("6. Click 'Import' and you're done!")
     print()
+    print("Or create the tasks through the API (resumable, no duplicates):")
+    print(f"   python -m quire import-csv {output_file} -p PROJECT_OID")
+    print()
     print("=" * 80)
     print()
     print("📊 Task Summary:")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Rank assignees by KPI score from the local mirror
+
+Scores completion rate, on-time ratio and priority-weighted throughput
+(see quire.kpi) for every assignee in the mirror. Run sync_mirror.py first.
+
+Usage:
+  python scripts/kpi_report.py
+  python scripts/kpi_report.py --top 20 --project PROJECT_OID
+  python scripts/kpi_report.py --since 2026-01-01 --csv kpi.csv
+"""
+
+import os
+import sys
+import csv
+import argparse
+from datetime import date
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quire.frame import TaskFrame
+from quire.kpi import KpiWeights, score_assignees
+from quire.sync import Mirror
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank assignees by KPI score")
+    parser.add_argument("--db", help="Mirror database (default: QUIRE_MIRROR_DB or quire_mirror.db)")
+    parser.add_argument("--project", help="Only score tasks of this project OID")
+    parser.add_argument("--since", help="Only score tasks due on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--top", type=int, default=10, help="Number of assignees to print (default: 10)")
+    parser.add_argument("--csv", help="Write every assignee's scores to this CSV file")
+    parser.add_argument("--weights", type=float, nargs=3, metavar=("COMPLETION", "ON_TIME", "THROUGHPUT"),
+                        help="Component weights (default: 0.4 0.3 0.3)")
+    
+    args = parser.parse_args()
+    
+    try:
+        with Mirror(args.db) as mirror:
+            frame = TaskFrame.from_mirror(mirror, args.project)
+        
+        mask = None
+        if args.since:
+            mask = frame.due_between(date.fromisoformat(args.since), date.max)
+        
+        weights = KpiWeights(*args.weights) if args.weights else None
+        scores = score_assignees(frame, weights=weights, mask=mask)
+        rows = scores.to_dicts()
+        
+        if not rows:
+            print("No assigned tasks in the mirror. Run sync_mirror.py first.")
+            return
+        
+        print(f"🏆 Top {min(args.top, len(rows))} of {len(rows)} assignee(s) over {len(frame)} task(s)\n")
+        print(f"{'#':>3}  {'Assignee':<28} {'Score':>6} {'Done':>10} {'On time':>8} {'Weighted':>9}")
+        for row in rows[:args.top]:
+            name = frame.assignee_names.get(row["assignee"], row["assignee"])
+            done = f"{row['completed']}/{row['assigned']}"
+            on_time = "-" if row["on_time_ratio"] is None else f"{row['on_time_ratio']:.0%}"
+            print(f"{row['rank']:>3}  {name[:28]:<28} {row['score']:>6.1f} {done:>10} "
+                  f"{on_time:>8} {row['throughput']:>9.1f}")
+        
+        if args.csv:
+            with open(args.csv, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=["rank", "assignee", "name"] + list(rows[0])[2:])
+                writer.writeheader()
+                for row in rows:
+                    writer.writerow({**row, "name": frame.assignee_names.get(row["assignee"], "")})
+            print(f"\n📄 Wrote {len(rows)} row(s) to {args.csv}")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from quire import QuireClient
+from quire import QuireClient, ResponseCache
 
 
 def main():
@@ -21,6 +21,7 @@ def main():
     parser.add_argument("project_oid", help="Project OID")
     parser.add_argument("--status", type=int, help="Filter by status code")
     parser.add_argument("--assignee", help="Filter by assignee OID")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the local response cache")
     
     args = parser.parse_args()
     
@@ -28,7 +29,7 @@ def main():
     print("=" * 80)
     
     try:
-        client = QuireClient()
+        client = QuireClient(cache=None if args.no_cache else ResponseCache())
         
         # Get project info
         project = client.get_project(args.project_oid)
@@ -37,20 +38,16 @@ def main():
             print(f"Description: {project.description}")
         print()
         
-        # List tasks
-        tasks = client.list_tasks(
+        # Stream tasks so output starts before the download finishes
+        tasks = client.iter_tasks(
             args.project_oid,
             status=args.status,
             assignee=args.assignee,
         )
         
-        if not tasks:
-            print("No tasks found.")
-            return
-        
-        print(f"Found {len(tasks)} task(s):\n")
-        
+        count = 0
         for i, task in enumerate(tasks, 1):
+            count = i
             print(f"{i}. {task}")
             print(f"   OID: {task.oid}")
             if task.description:
@@ -69,6 +66,11 @@ def main():
                 print(f"   Tags: {', '.join(task.tags)}")
             print()
         
+        if not count:
+            print("No tasks found.")
+            return
+        
+        print(f"Found {count} task(s).\n")
         print("=" * 80)
         print("\n💡 Tip: Update a task with:")
         print("   python scripts/update_task.py <TASK_OID> --status 10 --comment 'Done!'\n")
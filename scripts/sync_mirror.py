@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Sync a local SQLite mirror of the Quire workspace
+
+Only projects whose task list changed since the last run are rewritten.
+Every created/updated/deleted entity can be appended to an NDJSON feed.
+
+Usage:
+  python scripts/sync_mirror.py
+  python scripts/sync_mirror.py --db hrms.db --feed changes.ndjson --comments
+  python scripts/sync_mirror.py --project PROJECT_OID --feed -
+"""
+
+import os
+import sys
+import argparse
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quire import QuireClient, ResponseCache
+from quire.sync import Mirror
+
+
+def main():
+    load_dotenv()
+    
+    parser = argparse.ArgumentParser(description="Sync a local mirror of Quire projects and tasks")
+    parser.add_argument("--db", help="Mirror database (default: QUIRE_MIRROR_DB or quire_mirror.db)")
+    parser.add_argument("--feed", help="Append NDJSON change events to this file ('-' for stdout)")
+    parser.add_argument("--project", action="append", dest="projects", help="Only sync this project OID (repeatable)")
+    parser.add_argument("--comments", action="store_true", help="Also sync comments of changed tasks")
+    parser.add_argument("--concurrency", type=int, default=Mirror.DEFAULT_CONCURRENCY, help="Parallel project fetches")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the local response cache")
+    
+    args = parser.parse_args()
+    
+    feed = None
+    if args.feed == "-":
+        feed = sys.stdout
+    elif args.feed:
+        feed = open(args.feed, "a", encoding="utf-8")
+    
+    # Progress goes to stderr so `--feed -` stays pure NDJSON
+    log = sys.stderr if feed is sys.stdout else sys.stdout
+    
+    try:
+        client = QuireClient(
+            pool_size=args.concurrency,
+            cache=None if args.no_cache else ResponseCache(),
+        )
+        
+        with Mirror(args.db, feed=feed) as mirror:
+            print(f"🔄 Syncing into {mirror.path}...", file=log)
+            report = mirror.sync(
+                client,
+                project_oids=args.projects,
+                comments=args.comments,
+                concurrency=args.concurrency,
+            )
+        
+        print(f"✅ {report.projects} project(s), {report.projects_skipped} unchanged", file=log)
+        print(f"   Created: {report.created}  Updated: {report.updated}  Deleted: {report.deleted}", file=log)
+        
+        if report.errors:
+            print(f"\n⚠️  {len(report.errors)} project(s) or task comment list(s) failed:", file=log)
+            for oid, error in report.errors.items():
+                print(f"   ❌ {oid}: {error}", file=log)
+            sys.exit(1)
+            
+    except Exception as e:
+        print(f"❌ Error: {e}", file=log)
+        sys.exit(1)
+    finally:
+        if feed is not None and feed is not sys.stdout:
+            feed.close()
+
+
+if __name__ == "__main__":
+    main()
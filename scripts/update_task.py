@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from quire import QuireClient
+from quire import QuireClient, ResponseCache
 
 
 def main():
@@ -51,7 +51,8 @@ def main():
     print("=" * 80)
     
     try:
-        client = QuireClient()
+        # Shares the listing cache so the write invalidates it
+        client = QuireClient(cache=ResponseCache())
         
         # Get current task info
         task = client.get_task(args.task_oid)
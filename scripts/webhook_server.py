@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Keep a local SQLite mirror current from Quire webhooks instead of polling
+
+Seed the mirror once with scripts/sync_mirror.py, point a Quire webhook at
+this server (usually through a reverse proxy), and every task change is
+applied as it happens. GET /metrics shows throughput and lag.
+
+Usage:
+  python scripts/webhook_server.py
+  python scripts/webhook_server.py --db hrms.db --port 9000 --feed changes.ndjson
+  curl -s localhost:8787/metrics
+"""
+
+import os
+import sys
+import asyncio
+import argparse
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quire.sync import Mirror
+from quire.webhook import WebhookServer
+
+
+def main():
+    load_dotenv()
+    
+    parser = argparse.ArgumentParser(description="Apply Quire webhook events to a local mirror")
+    parser.add_argument("--db", help="Mirror database (default: QUIRE_MIRROR_DB or quire_mirror.db)")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=WebhookServer.DEFAULT_PORT, help="Port to listen on (default: 8787)")
+    parser.add_argument("--path", default="/webhook", help="Path Quire posts to (default: /webhook)")
+    parser.add_argument("--shards", type=int, default=8, help="Ordered event queues (default: 8)")
+    parser.add_argument("--feed", help="Append NDJSON change events to this file ('-' for stdout)")
+    parser.add_argument("--verbose", action="store_true", help="Print every applied event")
+    
+    args = parser.parse_args()
+    
+    feed = None
+    if args.feed == "-":
+        feed = sys.stdout
+    elif args.feed:
+        feed = open(args.feed, "a", encoding="utf-8")
+    log = sys.stderr if feed is sys.stdout else sys.stdout
+    
+    def on_event(event, op):
+        if args.verbose:
+            print(f"  {op or 'unchanged':<8} {event.task_oid}  {event.name}", file=log, flush=True)
+    
+    server = None
+    try:
+        with Mirror(args.db, feed=feed) as mirror:
+            server = WebhookServer(
+                mirror,
+                host=args.host,
+                port=args.port,
+                path=args.path,
+                shards=args.shards,
+                on_event=on_event,
+            )
+            if not server.secret:
+                print("⚠️  QUIRE_WEBHOOK_SECRET is not set; notifications are not verified", file=log)
+            print(f"📡 Listening on http://{args.host}:{args.port}{args.path} -> {mirror.path}", file=log, flush=True)
+            asyncio.run(server.run())
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"❌ Error: {e}", file=log)
+        sys.exit(1)
+    finally:
+        if feed is not None and feed is not sys.stdout:
+            feed.close()
+    
+    if server is not None:
+        m = server.metrics
+        print(f"\n✅ Applied {m.applied}, unchanged {m.unchanged}, failed {m.failed}, ignored {m.ignored}", file=log)
+
+
+if __name__ == "__main__":
+    main()